@@ -9,54 +9,88 @@
         dict2json:           To store the required data in JSON format
 
     Optionally, the function dict2csv can be used to get a list of the latitudes and longitudes of the measurement points.
+    Optionally, the function dict2geojson can be used to export the simplified trajectories of the sessions.
       
     For the visualization of the data, one or more of the following functions should be called.
         plotDurationPerWeek:     To plot two graphs: the duration of the measurements per week and the cumulative duration.
         plotMeasCountPerWeek:    To plot the cumulative number of the measurements for each GNSS system.
         plotDurationHistogram:   To plot the histogram of the duration of the sessions.
+        plotTrajectories:        To plot the simplified trajectories of the sessions.
+        plotSatelliteVisibility: To plot the number of satellites per GNSS system over the time of a session.
+
+    Alternatively, the function serveSessions can be used to serve the aggregates and the figures of an already processed project over HTTP.
 """  
 
 
 
 import os
-from dataFunctions import data2dict, dict2json, dict2csv
-from plotFunctions import plotDurationPerWeek, plotMeasCountPerWeek, plotDurationHistogram
+from dataFunctions import data2dict, dict2json, dict2csv, dict2geojson
+from plotFunctions import plotDurationPerWeek, plotMeasCountPerWeek, plotDurationHistogram, plotTrajectories, plotSatelliteVisibility
+from aggregateFunctions import foldSessions
+from serverFunctions import serveSessions
 
 
 # Please provide the folder name in which the CAMALIOT text files are stored. 
 # The folder must be located in the "\data" folder of the application.
 __PROJECTNAME__ = 'testDataSet'
 
+# Optionally, provide the tolerance in meters to simplify the trajectory of each session.
+# Set it to None to skip the trajectories.
+__TRAJECTORYTOLERANCE__ = None
 
+# Optionally, provide the interval in seconds to downsample the number of satellites per epoch and GNSS system of each session
+# (0 to keep every epoch). Set it to None to skip the satellite visibility.
+__VISIBILITYINTERVAL__ = None
 
-if __name__ == '__main__':
+# Optionally, provide a port to serve the aggregates and the figures of an already processed project over HTTP
+# (e.g., http://127.0.0.1:8000/figures/MeasDurationPerWeek.png). Set it to None to process the data and export the figures.
+__SERVERPORT__ = None
 
-    # Get the CAMALIOT text files in the directory "\data\{__PROJECTNAME__}" and extract data to a list of dictionaries "dataDictionary"
-    dataDictionary = data2dict(__PROJECTNAME__)
 
-    # Get the list of dictionaries "dataDictionary" and store the values in the {__PROJECTNAME__}.JSON file in the "\data" folder
-    dict2json(dataDictionary, __PROJECTNAME__)
 
-    # Get the list of dictionaries "dataDictionary" and store the longitude and latitude values in the {__PROJECTNAME__}.CSV file in the "\data" folder
-    dict2csv(dataDictionary, __PROJECTNAME__)
+if __name__ == '__main__':
 
     # Get the path of the JSON file
     jsonInFilename = os.path.abspath(os.path.join(os.getcwd(), "../data", __PROJECTNAME__ + ".json"))
-    
-    # Plot two graphs: the duration of the measurements per week and the cumulative duration (stored in the "\figures" folder)
-    plotDurationPerWeek(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'])
 
-    # Plot the cumulative number of the measurements for each GNSS system (stored in the "\figures" folder)
-    plotMeasCountPerWeek(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'])
+    if __SERVERPORT__ is not None:
+        # Serve the aggregates and the figures of the existing {__PROJECTNAME__}.JSON file over HTTP (the CAMALIOT text files are not processed)
+        serveSessions(__PROJECTNAME__, file = jsonInFilename, port = __SERVERPORT__)
 
-    # Plot the histogram of the duration of the sessions (stored in the "\figures" folder)
-    plotDurationHistogram(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'])
+    else:
+        # Get the CAMALIOT text files in the directory "\data\{__PROJECTNAME__}" and extract data to a list of dictionaries "dataDictionary"
+        dataDictionary = data2dict(__PROJECTNAME__, trajectoryTolerance = __TRAJECTORYTOLERANCE__, visibilityInterval = __VISIBILITYINTERVAL__)
 
- 
+        # Get the list of dictionaries "dataDictionary" and store the values in the {__PROJECTNAME__}.JSON file in the "\data" folder
+        dict2json(dataDictionary, __PROJECTNAME__)
+
+        # Get the list of dictionaries "dataDictionary" and store the longitude and latitude values in the {__PROJECTNAME__}.CSV file in the "\data" folder
+        dict2csv(dataDictionary, __PROJECTNAME__)
 
+        # Aggregate the sessions of the {__PROJECTNAME__}.JSON file once (weekly sums and histogram of the duration) for the following plots
+        folded = foldSessions(jsonInFilename, binning = 'fixed')
 
+        # Plot two graphs: the duration of the measurements per week and the cumulative duration (stored in the "\figures" folder)
+        plotDurationPerWeek(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'], folded = folded)
 
+        # Plot the cumulative number of the measurements for each GNSS system (stored in the "\figures" folder)
+        plotMeasCountPerWeek(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'], folded = folded)
+
+        # Plot the histogram of the duration of the sessions (stored in the "\figures" folder)
+        plotDurationHistogram(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'], folded = folded)
+
+        if __TRAJECTORYTOLERANCE__ is not None:
+            # Get the list of dictionaries "dataDictionary" and store the trajectories in the {__PROJECTNAME__}.GEOJSON file in the "\data" folder
+            dict2geojson(dataDictionary, __PROJECTNAME__)
+
+            # Plot the simplified trajectories of the sessions (stored in the "\figures" folder)
+            plotTrajectories(__PROJECTNAME__, file = jsonInFilename, format=['pdf', 'png', 'jpg'])
+
+ 
 
+        if __VISIBILITYINTERVAL__ is not None:
+            # Plot the number of satellites per GNSS system over the time of the first session (stored in the "\figures" folder)
+            plotSatelliteVisibility(__PROJECTNAME__, file = jsonInFilename, session = 0, format=['pdf', 'png', 'jpg'])
 
 
 
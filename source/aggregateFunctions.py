@@ -0,0 +1,203 @@
+import os
+import json
+import datetime
+import pandas as pd
+import numpy as np
+from histogramFunctions import StreamingHistogram, histogramEdges, reservoirSample
+
+
+# Approximate ratio of the memory of the parsed sessions (python dictionaries) to the size of their JSON text
+__PARSEDSIZEFACTOR__ = 5
+
+# The size of the blocks of text that are read from the session files (in bytes)
+__BLOCKSIZE__ = 2**20
+
+
+
+
+def iterSessionChunks(file, memoryLimit = 256):
+
+    """Read the sessions of a session store in chunks of bounded size.
+
+    The session store is either a JSON file (a list of sessions, as stored by the function dict2json, or one
+    session per line), or a folder of such files (e.g., one file per month), which are read in alphabetical order.
+    Only one chunk of sessions is kept in memory at a time.
+
+    Parameter:
+        file (type str):
+            The path of the JSON file or of the folder of JSON files.
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy.
+
+    Returns:
+        chunks (type generator):
+            The chunks of sessions (each chunk is a list of dictionaries).
+    """
+
+    # The maximum size of the JSON text of a chunk
+    chunkBytes = max(1, int(memoryLimit * 2**20 / __PARSEDSIZEFACTOR__))
+
+    if os.path.isdir(file):
+        files = [os.path.join(file, name) for name in sorted(os.listdir(file)) if name.endswith(('.json', '.jsonl'))]
+    else:
+        files = [file]
+
+    chunk = []
+    chunkSize = 0
+
+    for path in files:
+        with open(path, 'r') as inputFile:
+            for session, size in _iterJSONValues(inputFile):
+                chunk.append(session)
+                chunkSize += size
+                if chunkSize >= chunkBytes:
+                    yield chunk
+                    chunk = []
+                    chunkSize = 0
+
+    if chunk:
+        yield chunk
+
+
+
+def _iterJSONValues(inputFile):
+
+    # Decode the JSON values (sessions) one by one from blocks of text, skipping the brackets and commas
+    # of a list of sessions and the line breaks between sessions. Returns each value with the size of its text.
+    decoder = json.JSONDecoder()
+    buffer = ''
+
+    while True:
+        block = inputFile.read(__BLOCKSIZE__)
+        buffer += block
+        position = 0
+
+        while True:
+            # Skip the separators between the values
+            while position < len(buffer) and buffer[position] in ' \t\r\n,[]':
+                position += 1
+            if position == len(buffer):
+                break
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The value is not complete (the rest is in the next block)
+                if not block:
+                    raise
+                break
+            yield value, end - position
+            position = end
+
+        buffer = buffer[position:]
+        if not block:
+            return
+
+
+
+def weeklySums(dataJSON):
+
+    """Sum the duration and the number of measurements per GNSS system of the sessions per week of year.
+
+    The sums of different chunks of sessions can be combined by summing them again per week.
+
+    Parameter:
+        dataJSON (type list):
+            A list of dictionaries containing the required data (as stored in the JSON file).
+
+    Returns:
+        dfWeekly (type pandas.DataFrame):
+            The columns WOY, Duration [min] and one column per GNSS system, with one row per week with sessions.
+    """
+
+    # list to collect the required data for the plot
+    data2plot = []
+
+    # Iterate the imported list of dictionaries
+    for item in dataJSON:
+
+        # The starting date of each measurement session (the date part of "YYYY-MM-DD HH:MM:SS.ffffff"). It is used to compute the respective week of year (WOY)
+        date = datetime.date.fromisoformat(item['Start date-time'][:10])
+        # The week of year of the measurement session. (It is used in the current implementation to group the data to plot)
+        WOY = date.isocalendar()[1]
+
+        # List of the week of year and the duration of each measurement session
+        values2plot = [WOY, item['Duration [M.f]']]
+
+        # Add the measurement count per system as imported from the JSON file
+        values2plot.extend(list(item['MeasCountPerSystem'].values()))
+
+        # Append data to a list
+        data2plot.append(values2plot)
+
+
+    # Create the header (name of columns) of the dataframe
+    columns2plot = ['WOY', 'Duration']
+    columns2plot.extend(list(item['GnssSystems'].values()))
+
+    # Create a dataframe with the values to be used in the plot
+    df2plot = pd.DataFrame(data2plot, columns=columns2plot)
+    # Convert the JSON null (None type) values to numpy NaN values (also for the GNSS systems without any measurement)
+    df2plot = df2plot.astype(float).astype({'WOY': int})
+
+    # Group data with respect to the week of year
+    return df2plot.groupby('WOY', as_index=False).agg('sum')
+
+
+
+def foldSessions(file, memoryLimit = 256, binning = None, bins = None, maxDuration = None):
+
+    """Aggregate the sessions of a session store chunk by chunk (out-of-core).
+
+    Each chunk of sessions is folded into the weekly sums and the histogram of the duration of the sessions,
+    whose size does not depend on the number of sessions. Therefore, session stores larger than the memory
+    can be aggregated.
+
+    Parameter:
+        file (type str):
+            The path of the JSON file or of the folder of JSON files (see the function iterSessionChunks).
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy.
+        binning (type str):
+            The type of the bins of the histogram: 'fixed', 'log' or 'quantile' (see the function histogramEdges).
+            If None, the histogram is not computed.
+        bins (type float):
+            The width (fixed) or the number (log and quantile) of the bins of the histogram.
+        maxDuration (type float):
+            The last bin edge of the histogram in minutes (fixed and log).
+
+    Returns:
+        dfWeekly (type pandas.DataFrame):
+            The weekly sums as returned by the function weeklySums for all the sessions.
+        histogram (type StreamingHistogram):
+            The histogram of the duration of the sessions (None if binning is None).
+    """
+
+    def getDurations():
+        # The duration of the sessions in chunks (the JSON null values are counted as zero duration)
+        for chunk in iterSessionChunks(file, memoryLimit):
+            yield np.array([item['Duration [M.f]'] or 0 for item in chunk], dtype=float)
+
+    # The bin edges of the histogram (the quantile bins need a first pass over the sessions)
+    histogram = None
+    if binning is not None:
+        sample = reservoirSample(getDurations()) if binning == 'quantile' else None
+        histogram = StreamingHistogram(histogramEdges(binning, bins, maxDuration, sample))
+
+    dfWeekly = None
+
+    for chunk in iterSessionChunks(file, memoryLimit):
+
+        # Combine the weekly sums of the chunk with the weekly sums of the previous chunks
+        dfChunk = weeklySums(chunk)
+        if dfWeekly is None:
+            dfWeekly = dfChunk
+        else:
+            dfWeekly = pd.concat([dfWeekly, dfChunk]).groupby('WOY', as_index=False).agg('sum')
+
+        if histogram is not None:
+            histogram.add(np.array([item['Duration [M.f]'] or 0 for item in chunk], dtype=float))
+
+    if dfWeekly is None:
+        raise ValueError(f'There are no sessions in {file}.')
+
+    return dfWeekly, histogram
@@ -0,0 +1,169 @@
+import os
+import json
+import hashlib
+
+
+# Version of the rendering code. It is part of the hash of every figure, therefore it should be
+# increased whenever the appearance of the figures changes (e.g., colors, labels, fonts),
+# so that the figures rendered by an older version are not reused.
+__RENDERCACHEVERSION__ = 1
+
+# The figure formats that are supported by the application
+__FIGUREFORMATS__ = ['pdf', 'png', 'jpg']
+
+
+
+
+def figureHash(df2plot, plotName, format, dpi, size):
+
+    """Compute the content hash of a figure from the aggregated plot inputs and the plot parameters.
+
+    Parameter:
+        df2plot (type pandas.DataFrame):
+            The aggregated data that are used to render the figure.
+        plotName (type str):
+            The name of the plot (e.g., "MeasDurationPerWeek").
+        format (type list):
+            The list of the user-defined formats to export the figures.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        size (type tuple):
+            The width and height of the figure in inches.
+
+    Returns:
+        hashValue (type str):
+            The SHA-256 hash of the figure in hexadecimal format.
+    """
+
+    # The plot parameters that affect the exported figures
+    parameters = {'plotName': plotName,
+                  'format': sorted(format),
+                  'dpi': dpi,
+                  'size': [round(float(value), 6) for value in size],
+                  'version': __RENDERCACHEVERSION__,
+                  }
+
+    hashObject = hashlib.sha256()
+    # Add the plot parameters to the hash (sorted keys for a deterministic serialization)
+    hashObject.update(json.dumps(parameters, sort_keys=True).encode('utf-8'))
+    # Add the aggregated data to the hash (including the name of the columns and the index)
+    hashObject.update(df2plot.to_json(orient='split', double_precision=15).encode('utf-8'))
+
+    return hashObject.hexdigest()
+
+
+
+def _cacheFilePath(__PROJECTNAME__):
+
+    # The render cache of each project is stored in the \figures folder, next to the figures
+    return os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_RenderCache.json"))
+
+
+
+def _readCache(__PROJECTNAME__):
+
+    # An unreadable or missing render cache is equivalent to an empty one (i.e., all the figures are rendered)
+    try:
+        with open(_cacheFilePath(__PROJECTNAME__), 'r') as inputFile:
+            renderCache = json.load(inputFile)
+    except:
+        renderCache = {}
+
+    return renderCache
+
+
+
+def _writeCache(__PROJECTNAME__, renderCache):
+
+    try:
+        with open(_cacheFilePath(__PROJECTNAME__), 'w') as outFile:
+            outFile.write(json.dumps(renderCache, indent = 4, sort_keys=True))
+    except:
+        print('Problem with writing the render cache file.')
+        return 1
+
+    return 0
+
+
+
+def isFigureCached(__PROJECTNAME__, plotName, hashValue):
+
+    """Check if a figure with the same hash has already been exported in the \\figures folder.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        plotName (type str):
+            The name of the plot (e.g., "MeasDurationPerWeek").
+        hashValue (type str):
+            The hash of the figure as computed by the function figureHash.
+
+    Returns:
+        True if the figure is cached and all of its files exist, otherwise False.
+    """
+
+    entry = _readCache(__PROJECTNAME__).get(plotName)
+
+    if entry is None or entry.get('hash') != hashValue:
+        return False
+
+    # The figure is cached only if none of its files has been deleted in the meantime
+    dirPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/"))
+    return all(os.path.exists(os.path.join(dirPath, name)) for name in entry.get('files', []))
+
+
+
+def evictFigure(__PROJECTNAME__, plotName):
+
+    """Delete the stale files of a figure from the \\figures folder and remove it from the render cache.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        plotName (type str):
+            The name of the plot (e.g., "MeasDurationPerWeek").
+
+    Returns:
+        0
+    """
+
+    renderCache = _readCache(__PROJECTNAME__)
+    entry = renderCache.pop(plotName, {})
+
+    # The files recorded in the render cache, as well as the files of all the supported formats
+    # (e.g., figures exported before the render cache was introduced)
+    fileNames = set(entry.get('files', []))
+    fileNames.update(f"{__PROJECTNAME__}_{plotName}.{ext}" for ext in __FIGUREFORMATS__)
+
+    dirPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/"))
+    for name in fileNames:
+        figPath = os.path.join(dirPath, name)
+        if os.path.exists(figPath):
+            os.remove(figPath)
+
+    return _writeCache(__PROJECTNAME__, renderCache)
+
+
+
+def storeFigureHash(__PROJECTNAME__, plotName, hashValue, files):
+
+    """Record the hash and the exported files of a figure in the render cache.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        plotName (type str):
+            The name of the plot (e.g., "MeasDurationPerWeek").
+        hashValue (type str):
+            The hash of the figure as computed by the function figureHash.
+        files (type list):
+            The names of the exported files of the figure in the \\figures folder.
+
+    Returns:
+        0
+    """
+
+    renderCache = _readCache(__PROJECTNAME__)
+    renderCache[plotName] = {'hash': hashValue, 'files': sorted(files)}
+
+    return _writeCache(__PROJECTNAME__, renderCache)
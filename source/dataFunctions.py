@@ -4,172 +4,152 @@ import datetime
 import pandas as pd
 import numpy as np
 import json
+from trajectoryFunctions import simplifyTrajectory, encodePolyline, decodePolyline
+from schemaFunctions import readRecords
+from fingerprintFunctions import findDuplicates
+from visibilityFunctions import satelliteVisibility, __VISIBILITYCOLUMNS__
 
 
-def data2dict(__PROJECTNAME__):
+def data2dict(__PROJECTNAME__, trajectoryTolerance = None, checkpointInterval = 100, deduplicate = True, visibilityInterval = None):
     
     """Create a dictionary with the required data for the application.
     
+    The processing can be interrupted and resumed: the summary of each processed file is appended to the 
+    checkpoint file {__PROJECTNAME__}_Checkpoint.jsonl in the "\data" folder, and the files that are already 
+    in the checkpoint file are not processed again. The files that cannot be processed are not included in 
+    the data, but they are listed in the file {__PROJECTNAME__}_Quarantine.json in the "\data" folder.
+    The checkpoint file is deleted when all the files are processed.
+    
+    If the same session is found in more than one file (e.g., renamed, copied or truncated copies), only the most
+    complete copy is processed. The fingerprints of the files are stored in the file {__PROJECTNAME__}_Fingerprints.json
+    in the "\data" folder, so that only the new or modified files are fingerprinted in the next runs.
+    
     Parameter:
         __PROJECTNAME__ (type str): 
             The folder name in which the CAMALIOT text files are stored. 
             The CAMALIOT text file names follow the format:
             camaliot_app_log_YYYY_MM_DD_HH_MM_SS.txt
             The folder must be located in the "\data" folder of the application. 
+        trajectoryTolerance (type float):
+            Optional. The tolerance in meters to simplify the trajectory of each session (Douglas-Peucker).
+            If provided, the simplified trajectory is stored as an encoded polyline in the key
+            "Trajectory (encoded polyline)" of each session. If None, the trajectories are not computed.
+        checkpointInterval (type int):
+            The number of processed files after which the checkpoint file is synchronized to the disk.
+        deduplicate (type bool):
+            If True, the duplicate copies of the sessions are not processed.
+        visibilityInterval (type float):
+            Optional. The number of satellites per epoch and GNSS system (satellite visibility) of each session is
+            stored in the key "SatelliteVisibility" of each session, downsampled to intervals of the given seconds
+            (0 to keep every epoch, otherwise at least 0.001 seconds). If None, the satellite visibility is not computed.
+            The sessions whose "# Raw" header lacks the required columns are stored without the satellite visibility.
                     
     Returns: 
         dataDict (type list): 
             A list of dictionaries containing the required data.
     """   
 
+    # The interval of the satellite visibility is checked before any file is processed
+    # (an invalid interval is an error of the caller, not of the CAMALIOT text files)
+    if visibilityInterval is not None and visibilityInterval != 0 and round(visibilityInterval * 1000) <= 0:
+        raise ValueError('The visibilityInterval must be 0 (every epoch) or at least 0.001 seconds.')
+    
     # Initialize the list of dictionaries containing the required data
     dataDict = []
     
     
     # Get the directory of the CAMALIOT text files
     dirPath = os.path.abspath(os.path.join(os.getcwd(), "../data/", __PROJECTNAME__))
+    
+    # Get the path of the checkpoint file and of the quarantine file
+    checkpointPath = os.path.abspath(os.path.join(os.getcwd(), "../data/", __PROJECTNAME__ + "_Checkpoint.jsonl"))
+    quarantinePath = os.path.abspath(os.path.join(os.getcwd(), "../data/", __PROJECTNAME__ + "_Quarantine.json"))
+    
+    # The parameters of the processing (a checkpoint is resumed only if it was created with the same parameters)
+    parameters = {"trajectoryTolerance": trajectoryTolerance, "visibilityInterval": visibilityInterval}
+    
+    # Get the duplicate copies of the sessions (they are not processed)
+    duplicates = {}
+    if deduplicate:
+        indexPath = os.path.abspath(os.path.join(os.getcwd(), "../data/", __PROJECTNAME__ + "_Fingerprints.json"))
+        duplicates = findDuplicates(dirPath, indexPath)
+        if duplicates:
+            print(f'{len(duplicates)} CAMALIOT text files are duplicate copies of other sessions and they are skipped.')
+    
+    # Get the files that are already processed (completed) or could not be processed (quarantine)
+    completed, quarantine, checkpointSize = readCheckpoint(checkpointPath, parameters)
+    if completed or quarantine:
+        print(f'Resuming from the checkpoint ({len(completed) + len(quarantine)} files are already processed).')
+        # Remove the incomplete last line (if any), so that the new records are appended after a complete line
+        os.truncate(checkpointPath, checkpointSize)
+        checkpointFile = open(checkpointPath, 'a')
+    else:
+        checkpointFile = open(checkpointPath, 'w')
+        checkpointFile.write(json.dumps({"parameters": parameters}) + '\n')
 
     cnt = 0
+    processedCnt = 0
     checkPercentage = 5
     print('Processing progress: ', end='')
-    # Get a list of the CAMALIOT text files in the user-defined folder
-    for path, subdirs, files in os.walk(dirPath):
-
-        # Iterate the files
-        for name in files:
-            # Construct the file path for each file
-            fullPath = path + "\\" + name
-
-            # Initiaize a list to contain data from the lines starting with the keyword "Fix"
-            fixLines = []
-            # Initiaize a list to contain the constellationType values of the lines starting with the keyword "Raw"
-            constellationType = []
-            
-            cnt += 1
-            donePercentage = 100*cnt/len(files)
-            if donePercentage > checkPercentage:
-                print('* ', end='')
-                checkPercentage += 5
+    try:
+        # Get a list of the CAMALIOT text files in the user-defined folder
+        for path, subdirs, files in os.walk(dirPath):
+
+            # Iterate the files
+            for name in sorted(files):
+                # Construct the file path for each file
+                fullPath = os.path.join(path, name)
+                # The file path relative to the project folder identifies the file in the checkpoint
+                relPath = os.path.relpath(fullPath, dirPath)
             
+                cnt += 1
+                donePercentage = 100*cnt/len(files)
+                if donePercentage > checkPercentage:
+                    print('* ', end='')
+                    checkPercentage += 5
             
-            try:
-                # Opening CAMALIOT text file to read
-                with open(fullPath, 'r') as inputfile:
-                    # Iterate the lines of the files
-                    for line in inputfile:
-                        
-                        # From the line staring with "# Fix" get the header of the data 
-                        if line.split(',')[0] == "# Fix":    
-                            line = line.strip()                     # (this it to remove the trailing "\n")
-                            fixLinesHeader = line.split(',')[2:]    # (ignore the first two, i.e. Fix and Provider)
-                            
-                        # From the line staring with "Fix" get the values of the data 
-                        elif line.split(',')[0] == "Fix":
-                            fixLines.append(float(item) for item in line.split(',')[2:])   # (ignore the first two, i.e. Fix and gps)
-                            
-                        # From the line staring with "Raw" get the values of the constellationType 
-                        if line.split(',')[0] == "Raw":                
-                            constellationType.append(line.split(',')[28])  # (position 28 in the list)
-                # Close file            
-                inputfile.close() 
-            except:
-                print('Problem with opening CAMALIOT text files.')
-                return 1
-                    
-            # Initialize pandas dataframe to store the "Fix" data   
-            dfFix = pd.DataFrame(fixLines, columns=fixLinesHeader)   
+                # Skip the duplicate copies of the sessions
+                if relPath in duplicates:
+                    continue
             
-            # Initialize pandas dataframe to store the constellationType values of the "Raw" data
-            dfRaw = pd.DataFrame(constellationType, columns=['constellationType'])
-              
-            # Initialize pandas dataframe to match the GNSS systems with the constellationType values
-            dfRawNumInit = pd.DataFrame(['UNKNOWN','GPS','SBAS','GLONASS','QZSS','BEIDOU','GALILEO','IRNSS'], 
-                            index=['0','1','2','3','4','5','6','7'], columns=['gnssSystems'] )
+                # Skip the files that are already processed
+                if relPath in completed:
+                    dataDict.append(completed[relPath])
+                    continue
+                if relPath in quarantine:
+                    continue
             
-            # Initialize pandas dataframe to store the measurement count per GNSS system
-            dfRawCnt = dfRaw['constellationType'].value_counts().to_frame()
-            dfRawCnt.columns = ['MeasCountPerSystem']
-                 
-            # Initialize pandas dataframe to store the measurement percentage per GNSS system
-            dfRawPer = dfRaw['constellationType'].value_counts(1).to_frame() # (1 is used to get the frequencies)
-            dfRawPer.columns = ['MeasPercentagePerSystem']
+                try:
+                    session = file2dict(fullPath, trajectoryTolerance, visibilityInterval)
+                except Exception as error:
+                    # Put the file in quarantine and continue with the next file
+                    quarantine[relPath] = f'{type(error).__name__}: {error}'
+                    checkpointFile.write(json.dumps({"file": relPath, "error": quarantine[relPath]}) + '\n')
+                else:
+                    dataDict.append(session)
+                    checkpointFile.write(json.dumps({"file": relPath, "session": session}) + '\n')
             
-            # Initialize pandas dataframe to combine the required information
-            dfRawStat = pd.concat([dfRawNumInit, dfRawCnt, dfRawPer], axis=1)
+                # Periodically synchronize the checkpoint file to the disk
+                processedCnt += 1
+                if processedCnt % checkpointInterval == 0:
+                    checkpointFile.flush()
+                    os.fsync(checkpointFile.fileno())
+    finally:
+        # Keep the processed files in the checkpoint, also if the processing is interrupted by an exception
+        checkpointFile.close()
 
-            # Round percentages to two digits
-            dfRawStat['MeasPercentagePerSystem'] = dfRawStat['MeasPercentagePerSystem'].round(2)
-            
-            # Replace the default NaN value to None that is to compatible with the JSON format
-            dfRawStat = dfRawStat.replace({np.NaN: None})
-            
-            # Convert pandas dataframe to dictionary
-            dictStat = dfRawStat.to_dict()
-
-            # Append information while iterating the data files
-            dataDict.append({
-                            # Timestamp of the first measurement (minimum in the list of timestamps "(UTC)TimeInMs") 
-                            "Start date-time": datetime.datetime.fromtimestamp(dfFix['(UTC)TimeInMs'].min()/1000.0).strftime('%Y-%m-%d %H:%M:%S.%f'),
-                            # Duration of measurement (maximum - minimum of the timestamps "(UTC)TimeInMs") in [MM:SS] format
-                            "Duration [MM:SS]": datetime.datetime.fromtimestamp((dfFix['(UTC)TimeInMs'].max()-dfFix['(UTC)TimeInMs'].min())/1000.0).strftime('%M:%S'),
-                            # Duration of measurement (maximum - minimum of the timestamps "(UTC)TimeInMs") in decimal minutes [MM:f] format
-                            "Duration [M.f]": round((dfFix['(UTC)TimeInMs'].max()-dfFix['(UTC)TimeInMs'].min())/60000, 4),
-                            # Latitude of the measurment (median of the list of latitudes) in decimal degrees [deg] format
-                            "Latitude (median) [deg]": round(dfFix['Latitude'].median(), 6),
-                            # Longitude of the measurment (median of the list of Longitudes) in decimal degrees [deg] format
-                            "Longitude (median) [deg]": round(dfFix['Longitude'].median(), 6),
-                            # Total count of measurements (number of "Raw" records)
-                            "TotalCountOfMeas": int(len(dfRaw)),
-                            # Dictionary matching constellationType to the name of the GNSS system
-                            "GnssSystems" : dictStat['gnssSystems'],
-                            # Dictionary matching constellationType to the count of measurements for each GNSS system
-                            "MeasCountPerSystem" : dictStat['MeasCountPerSystem'],
-                            # Dictionary matching constellationType to the percentage of measurements for each GNSS system
-                            "MeasPercentagePerSystem" : dictStat['MeasPercentagePerSystem']
-                            }
-            )
-            
-            # Example of the dataDict structure
-            # {
-            #     "Start date-time": "2022-03-26 17:17:44.688000",
-            #     "Duration [MM:SS]": "10:29",
-            #     "Duration [M.f]": 10.4885,
-            #     "Latitude (median) [deg]": 36.197195,
-            #     "Longitude (median) [deg]":16.123804,
-            #     "TotalCountOfMeas": 15468,
-            #     "GnssSystems": {
-            #         "0": "UNKNOWN",
-            #         "1": "GPS",
-            #         "2": "SBAS",
-            #         "3": "GLONASS",
-            #         "4": "QZSS",
-            #         "5": "BEIDOU",
-            #         "6": "GALILEO",
-            #         "7": "IRNSS"
-            #     },
-            #     "MeasCountPerSystem": {
-            #         "0": null,
-            #         "1": 4976.0,
-            #         "2": null,
-            #         "3": 4117.0,
-            #         "4": null,
-            #         "5": 6375.0,
-            #         "6": null,
-            #         "7": null
-            #     },
-            #     "MeasPercentagePerSystem": {
-            #         "0": null,
-            #         "1": 0.32,
-            #         "2": null,
-            #         "3": 0.27,
-            #         "4": null,
-            #         "5": 0.41,
-            #         "6": null,
-            #         "7": null
-            #     }
-            # }
-                
-        print('\nAll files are processed!')
+    print('\nAll files are processed!')
+    
+    # Store the list of the files that could not be processed
+    if quarantine:
+        with open(quarantinePath, 'w') as outFile:
+            outFile.write(json.dumps(quarantine, indent = 4))
+        print(f'Problem with {len(quarantine)} CAMALIOT text files. They are listed in the {__PROJECTNAME__}_Quarantine.json file in the \\data folder.')
+    elif os.path.exists(quarantinePath):
+        os.remove(quarantinePath)
+    
+    # The checkpoint is not needed anymore
+    os.remove(checkpointPath)
                 
     return dataDict
 
@@ -177,6 +157,208 @@ def data2dict(__PROJECTNAME__):
 
 
 
+def file2dict(fullPath, trajectoryTolerance = None, visibilityInterval = None):
+    
+    """Extract the required data of a measurement session from a CAMALIOT text file.
+    
+    Parameter:
+        fullPath (type str): 
+            The path of the CAMALIOT text file.
+        trajectoryTolerance (type float):
+            Optional. The tolerance in meters to simplify the trajectory of the session (see data2dict).
+        visibilityInterval (type float):
+            Optional. The interval in seconds of the satellite visibility of the session (see data2dict).
+            If the "# Raw" header of the file lacks the required columns, the session is stored without it.
+                    
+    Returns: 
+        session (type dict): 
+            A dictionary containing the required data of the session.
+            An exception is raised if the file cannot be read or it contains no valid "Fix" data.
+    """   
+
+    # Get the "Fix" data and the constellationType values of the "Raw" data (and the epochs and satellites for the visibility)
+    # (the positions of the columns are resolved from the "# Fix" and "# Raw" headers of the file)
+    visibility = visibilityInterval is not None
+    if visibility:
+        try:
+            dfFix, dfRaw = readRecords(fullPath, rawColumns=__VISIBILITYCOLUMNS__)
+        except ValueError:
+            # The "# Raw" header lacks the columns of the satellite visibility (e.g., an older version of the app),
+            # so the session is stored without the satellite visibility
+            visibility = False
+    if not visibility:
+        dfFix, dfRaw = readRecords(fullPath)
+      
+    # Initialize pandas dataframe to match the GNSS systems with the constellationType values
+    dfRawNumInit = pd.DataFrame(['UNKNOWN','GPS','SBAS','GLONASS','QZSS','BEIDOU','GALILEO','IRNSS'], 
+                    index=['0','1','2','3','4','5','6','7'], columns=['gnssSystems'] )
+    
+    # Initialize pandas dataframe to store the measurement count per GNSS system
+    dfRawCnt = dfRaw['ConstellationType'].value_counts().to_frame()
+    dfRawCnt.columns = ['MeasCountPerSystem']
+         
+    # Initialize pandas dataframe to store the measurement percentage per GNSS system
+    dfRawPer = dfRaw['ConstellationType'].value_counts(1).to_frame() # (1 is used to get the frequencies)
+    dfRawPer.columns = ['MeasPercentagePerSystem']
+    
+    # Initialize pandas dataframe to combine the required information
+    dfRawStat = pd.concat([dfRawNumInit, dfRawCnt, dfRawPer], axis=1)
+
+    # Round percentages to two digits
+    dfRawStat['MeasPercentagePerSystem'] = dfRawStat['MeasPercentagePerSystem'].round(2)
+    
+    # Replace the default NaN value to None that is to compatible with the JSON format
+    dfRawStat = dfRawStat.replace({np.nan: None})
+    
+    # Convert pandas dataframe to dictionary
+    dictStat = dfRawStat.to_dict()
+
+    # Collect the information of the session
+    session = {
+        # Timestamp of the first measurement (minimum in the list of timestamps "(UTC)TimeInMs") 
+        "Start date-time": datetime.datetime.fromtimestamp(dfFix['(UTC)TimeInMs'].min()/1000.0).strftime('%Y-%m-%d %H:%M:%S.%f'),
+        # Duration of measurement (maximum - minimum of the timestamps "(UTC)TimeInMs") in [MM:SS] format
+        "Duration [MM:SS]": datetime.datetime.fromtimestamp((dfFix['(UTC)TimeInMs'].max()-dfFix['(UTC)TimeInMs'].min())/1000.0).strftime('%M:%S'),
+        # Duration of measurement (maximum - minimum of the timestamps "(UTC)TimeInMs") in decimal minutes [MM:f] format
+        "Duration [M.f]": round((dfFix['(UTC)TimeInMs'].max()-dfFix['(UTC)TimeInMs'].min())/60000, 4),
+        # Latitude of the measurment (median of the list of latitudes) in decimal degrees [deg] format
+        "Latitude (median) [deg]": round(dfFix['Latitude'].median(), 6),
+        # Longitude of the measurment (median of the list of Longitudes) in decimal degrees [deg] format
+        "Longitude (median) [deg]": round(dfFix['Longitude'].median(), 6),
+        # Total count of measurements (number of "Raw" records)
+        "TotalCountOfMeas": int(len(dfRaw)),
+        # Dictionary matching constellationType to the name of the GNSS system
+        "GnssSystems" : dictStat['gnssSystems'],
+        # Dictionary matching constellationType to the count of measurements for each GNSS system
+        "MeasCountPerSystem" : dictStat['MeasCountPerSystem'],
+        # Dictionary matching constellationType to the percentage of measurements for each GNSS system
+        "MeasPercentagePerSystem" : dictStat['MeasPercentagePerSystem']
+        }
+
+    # Append the simplified trajectory of the session (optional)
+    # (the "Fix" records with invalid coordinates are not part of the trajectory)
+    dfTrajectory = dfFix.dropna(subset=['Latitude', 'Longitude']) if trajectoryTolerance is not None else None
+    if dfTrajectory is not None and not dfTrajectory.empty:
+        # Sort the "Fix" data in chronological order
+        dfTrajectory = dfTrajectory.sort_values('(UTC)TimeInMs')
+        lat = dfTrajectory['Latitude'].to_numpy()
+        lon = dfTrajectory['Longitude'].to_numpy()
+        # Keep only the points that are required to describe the trajectory within the tolerance
+        keep = simplifyTrajectory(lat, lon, trajectoryTolerance)
+        session["Trajectory (encoded polyline)"] = encodePolyline(lat[keep], lon[keep])
+    
+    # Append the number of satellites per epoch and GNSS system of the session (optional)
+    if visibility:
+        session["SatelliteVisibility"] = satelliteVisibility(dfRaw, visibilityInterval)
+    
+    # Example of the dataDict structure
+    # {
+    #     "Start date-time": "2022-03-26 17:17:44.688000",
+    #     "Duration [MM:SS]": "10:29",
+    #     "Duration [M.f]": 10.4885,
+    #     "Latitude (median) [deg]": 36.197195,
+    #     "Longitude (median) [deg]":16.123804,
+    #     "TotalCountOfMeas": 15468,
+    #     "GnssSystems": {
+    #         "0": "UNKNOWN",
+    #         "1": "GPS",
+    #         "2": "SBAS",
+    #         "3": "GLONASS",
+    #         "4": "QZSS",
+    #         "5": "BEIDOU",
+    #         "6": "GALILEO",
+    #         "7": "IRNSS"
+    #     },
+    #     "MeasCountPerSystem": {
+    #         "0": null,
+    #         "1": 4976.0,
+    #         "2": null,
+    #         "3": 4117.0,
+    #         "4": null,
+    #         "5": 6375.0,
+    #         "6": null,
+    #         "7": null
+    #     },
+    #     "MeasPercentagePerSystem": {
+    #         "0": null,
+    #         "1": 0.32,
+    #         "2": null,
+    #         "3": 0.27,
+    #         "4": null,
+    #         "5": 0.41,
+    #         "6": null,
+    #         "7": null
+    #     }
+    # }
+
+    return session
+
+
+
+
+
+def readCheckpoint(checkpointPath, parameters):
+    
+    """Read the files that are already processed from a checkpoint file (see data2dict).
+    
+    Parameter:
+        checkpointPath (type str): 
+            The path of the checkpoint file.
+        parameters (type dict): 
+            The parameters of the processing. The checkpoint is ignored if it was created with other parameters.
+                    
+    Returns: 
+        completed (type dict): 
+            The summary of each processed file (the key is the file path relative to the project folder).
+        quarantine (type dict): 
+            The error message of each file that could not be processed.
+        size (type int): 
+            The size in bytes of the complete lines of the checkpoint file. The rest of the file (an incomplete 
+            last line) must be removed before new records are appended.
+    """   
+
+    completed = {}
+    quarantine = {}
+    size = 0
+    
+    try:
+        with open(checkpointPath, 'rb') as inputFile:
+            # The first line contains the parameters of the processing
+            line = inputFile.readline()
+            if not line.endswith(b'\n'):
+                return {}, {}, 0
+            if json.loads(line).get("parameters") != parameters:
+                print('The checkpoint was created with other parameters and it is ignored.')
+                return {}, {}, 0
+            size += len(line)
+            
+            for line in inputFile:
+                # The last line may be incomplete if the processing was interrupted while writing
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if "session" in record:
+                    completed[record["file"]] = record["session"]
+                else:
+                    quarantine[record["file"]] = record["error"]
+                size += len(line)
+    except (OSError, ValueError):
+        # There is no (valid) checkpoint
+        return {}, {}, 0
+    
+    return completed, quarantine, size
+
+
+
+
+
+
+
+
+
 def dict2json(data, __PROJECTNAME__):
 
     """Serialize data and store them in a JSON format file.
@@ -257,6 +439,66 @@ def dict2csv(data, __PROJECTNAME__):
     
     print(f"The {__PROJECTNAME__}.csv file is stored in the \\data folder.")
     return 0
+
+
+
+def dict2geojson(data, __PROJECTNAME__):
+
+    """Export the simplified trajectories of the sessions in a GeoJSON format file
+    
+    Parameter:
+        data (type list): 
+            A list of dictionaries containing the required data.
+            The trajectories are available only if the function data2dict is called with the option trajectoryTolerance.
+        __PROJECTNAME__ (type str): 
+            The folder name in which the CAMALIOT text files are stored. 
+            The CAMALIOT text file names follow the format:
+            camaliot_app_log_YYYY_MM_DD_HH_MM_SS.txt
+            The folder must be located in the "\data" folder of the application. 
+    
+    Returns: 
+        0
+    """   
+
+    # Get the path to create the GeoJSON file
+    filePath = os.path.abspath(os.path.join(os.getcwd(), "../data/", __PROJECTNAME__ + ".geojson"))
+
+    # Initialize the list of the trajectories (one LineString feature per session)
+    features = []
+    
+    # Iterate the list of dictionaries
+    for item in data:
+        
+        # Skip the sessions without trajectory
+        if "Trajectory (encoded polyline)" not in item:
+            continue
+        
+        # Decode the trajectory (GeoJSON coordinates are in longitude, latitude order)
+        lat, lon = decodePolyline(item["Trajectory (encoded polyline)"])
+        coordinates = np.column_stack([lon, lat]).round(6).tolist()
+        
+        features.append({
+                        "type": "Feature",
+                        "geometry": {"type": "LineString" if len(coordinates) > 1 else "Point",
+                                     "coordinates": coordinates if len(coordinates) > 1 else coordinates[0]},
+                        "properties": {"Start date-time": item["Start date-time"],
+                                       "Duration [M.f]": item["Duration [M.f]"],
+                                       "TotalCountOfMeas": item["TotalCountOfMeas"]}
+                        }
+        )
+    
+    try:
+        # Writing to GeoJSON file
+        with open(filePath, 'w') as outFile:
+            outFile.write(json.dumps({"type": "FeatureCollection", "features": features}))
+        
+        outFile.close()                     
+    except:
+        print('Problem with writing the GeoJSON file.')
+        return 1
+    
+    print(f"The {__PROJECTNAME__}.geojson file is stored in the \\data folder.")
+    return 0
        
 
     
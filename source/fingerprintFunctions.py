@@ -0,0 +1,177 @@
+import os
+import json
+import hashlib
+from schemaFunctions import parseHeader, compileExtractor
+
+
+# The number of "Fix" records that are read at the start and at the end of a file (to find its first and last complete records)
+__FINGERPRINTRECORDS__ = 10
+
+# The size of the blocks that are read from the end of a file to find the last "Fix" records (in bytes)
+__TAILBLOCKSIZE__ = 2**16
+
+# Version of the fingerprints. It is stored in the fingerprint index, therefore it should be increased
+# whenever the computation of the fingerprints changes, so that the fingerprints of an older version are not reused.
+__FINGERPRINTVERSION__ = 3
+
+
+
+
+def fileFingerprint(fullPath, records = __FINGERPRINTRECORDS__):
+
+    """Compute the fingerprint of a CAMALIOT text file without parsing the whole file.
+
+    Only the header lines, the first and the last "Fix" records of the file are read. The session key
+    identifies the measurement session by what every copy of the session shares (the device hint and the
+    first complete "Fix" record), so that renamed, copied and truncated copies of the same session have the
+    same key, however short they are. The end time and the size of the file indicate how complete each copy is.
+
+    Parameter:
+        fullPath (type str):
+            The path of the CAMALIOT text file.
+        records (type int):
+            The number of "Fix" records that are read at the start and at the end of the file.
+
+    Returns:
+        fingerprint (type dict):
+            The keys "session" (hash of the device hint and the first complete "Fix" record), "start" and "end"
+            (the first and last (UTC)TimeInMs) and "size" (in bytes).
+            The session key is None if the file contains no complete "Fix" records.
+    """
+
+    device = b''
+    timeExtractor = None
+    firstRecords = []
+
+    with open(fullPath, 'rb') as inputFile:
+
+        # Read the header and the first "Fix" records from the start of the file
+        for line in inputFile:
+            if line.startswith(b'#'):
+                # The device hint (e.g., "# Version: 2.0.0.0 Platform: 11 Manufacturer: Xiaomi Model: 2107113SG")
+                if line.startswith(b'# Version'):
+                    device = line.strip()
+                # The position of the time in the "Fix" records
+                record, header = parseHeader(line.decode('utf-8', 'replace'))
+                if record == 'Fix':
+                    timeExtractor = compileExtractor(header, ('(UTC)TimeInMs',))
+            elif line.startswith(b'Fix,') and timeExtractor is not None:
+                firstRecords.append(line.strip())
+                if len(firstRecords) == records:
+                    break
+
+        # Read the last "Fix" records from the end of the file, down to the position of the forward scan
+        # (if the end of the file is reached by the forward scan, all the "Fix" records are already read)
+        scanned = inputFile.tell()
+        size = inputFile.seek(0, os.SEEK_END)
+        tailRecords = _lastRecords(inputFile, scanned, size, records) if firstRecords else []
+
+    # Only the complete records are used (e.g., the last line of an interrupted upload is not complete)
+    firstRecords = [line for line in firstRecords if len(line.split(b',')) >= timeExtractor.width]
+    lastRecords = [line for line in firstRecords + tailRecords if len(line.split(b',')) >= timeExtractor.width][-records:]
+
+    if not firstRecords:
+        return {'session': None, 'start': None, 'end': None, 'size': size}
+
+    start = float(timeExtractor.getter(firstRecords[0].split(b',')))
+    end = float(timeExtractor.getter(lastRecords[-1].split(b',')))
+
+    sessionHash = hashlib.sha256(b'\n'.join([device, firstRecords[0]])).hexdigest()
+
+    return {'session': sessionHash, 'start': start, 'end': end, 'size': size}
+
+
+
+def _lastRecords(inputFile, start, size, records):
+
+    # Read blocks backwards from the end of the file (down to the position start, which is at the start of a line)
+    # until the last "Fix" records are found. Only the incomplete first line of each block is kept for the next block.
+    position = size
+    partial = b''
+    found = []
+
+    while position > start and len(found) < records:
+        step = min(__TAILBLOCKSIZE__, position - start)
+        position -= step
+        inputFile.seek(position)
+        lines = (inputFile.read(step) + partial).split(b'\n')
+
+        # The first line of the block may be incomplete, unless the start position is reached
+        partial = lines.pop(0) if position > start else b''
+        found = [line.strip() for line in lines if line.startswith(b'Fix,')] + found
+
+    return found[-records:]
+
+
+
+def findDuplicates(dirPath, indexPath, records = __FINGERPRINTRECORDS__):
+
+    """Find the duplicate copies of the measurement sessions in a folder of CAMALIOT text files.
+
+    The copies of a session (renamed, copied to another subfolder, or truncated) have the same session key
+    (see the function fileFingerprint). Only the most complete copy of each session is kept: the one with the
+    latest end time, then the largest size, then the first in alphabetical order.
+    The fingerprints are stored in a persistent index, so that only new or modified files are read in the next runs.
+
+    Parameter:
+        dirPath (type str):
+            The folder of the CAMALIOT text files.
+        indexPath (type str):
+            The path of the JSON file of the fingerprint index (it is created if it does not exist).
+        records (type int):
+            The number of "Fix" records at the start and at the end of each file that are used.
+
+    Returns:
+        duplicates (type dict):
+            The path (relative to the folder) of each duplicate file and the path of the copy that is kept.
+    """
+
+    # Read the fingerprint index of the previous runs
+    try:
+        with open(indexPath, 'r') as inputFile:
+            index = json.load(inputFile)
+        if index.get('records') != records or index.get('version') != __FINGERPRINTVERSION__:
+            index = {}
+    except:
+        index = {}
+    files = index.get('files', {})
+
+    # The fingerprint of each file (reused from the index, if the file is not modified)
+    fingerprints = {}
+    for path, subdirs, names in os.walk(dirPath):
+        for name in names:
+            fullPath = os.path.join(path, name)
+            relPath = os.path.relpath(fullPath, dirPath)
+            stat = os.stat(fullPath)
+
+            entry = files.get(relPath)
+            if entry is None or entry['size'] != stat.st_size or entry['mtime'] != stat.st_mtime:
+                try:
+                    entry = fileFingerprint(fullPath, records)
+                except Exception:
+                    # The file cannot be read (it is not deduplicated, and data2dict puts it in quarantine)
+                    continue
+                entry['mtime'] = stat.st_mtime
+            fingerprints[relPath] = entry
+
+    # The most complete copy of each session (a dictionary lookup per file)
+    kept = {}
+    for relPath in sorted(fingerprints):
+        entry = fingerprints[relPath]
+        if entry['session'] is None:
+            continue
+        best = kept.get(entry['session'])
+        if best is None or (entry['end'], entry['size']) > (fingerprints[best]['end'], fingerprints[best]['size']):
+            kept[entry['session']] = relPath
+
+    duplicates = {relPath: kept[entry['session']] for relPath, entry in fingerprints.items()
+                  if entry['session'] is not None and kept[entry['session']] != relPath}
+
+    # Store the fingerprint index (only the files that still exist)
+    try:
+        with open(indexPath, 'w') as outFile:
+            outFile.write(json.dumps({'version': __FINGERPRINTVERSION__, 'records': records, 'files': fingerprints}))
+    except:
+        print('Problem with writing the fingerprint index file.')
+
+    return duplicates
@@ -0,0 +1,274 @@
+import json
+import numpy as np
+import pandas as pd
+
+
+# The default bin edges of the histogram of the duration of the sessions (in minutes)
+#   fixed:    bins of equal width (the width is given by the parameter bins) up to maxDuration
+#   log:      logarithmic bins (the number is given by the parameter bins) from __LOGMINDURATION__ up to maxDuration
+#   quantile: bins with (approximately) the same number of sessions (the number is given by the parameter bins)
+__BINNINGS__ = {'fixed':    {'bins': 1,  'maxDuration': 120},
+                'log':      {'bins': 30, 'maxDuration': 7*24*60},
+                'quantile': {'bins': 20, 'maxDuration': None},
+                }
+__LOGMINDURATION__ = 0.1
+
+
+
+
+class StreamingHistogram:
+
+    """Histogram with fixed bin edges that is accumulated chunk by chunk.
+
+    The state of the histogram has a fixed size (it does not depend on the number of values), it can be
+    stored in a JSON file and merged with the state of another histogram with the same bin edges.
+    The values above the last bin edge are counted in the overflow bin and the values below the
+    first bin edge in the underflow bin.
+
+    Parameter:
+        edges (type numpy.ndarray):
+            The bin edges in increasing order. Each bin includes its left edge and excludes its right edge.
+    """
+
+    def __init__(self, edges):
+
+        self.edges = np.asarray(edges, dtype=float)
+        if self.edges.ndim != 1 or len(self.edges) < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError('The bin edges must be at least two increasing values.')
+
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.total = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+
+    @property
+    def count(self):
+
+        """The number of values in the histogram (including the underflow and overflow bins)."""
+
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+
+    def add(self, values):
+
+        """Add a chunk of values to the histogram (the NaN values are ignored)."""
+
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        # Index of the bin of each value (0 for the underflow, len(edges) for the overflow)
+        index = np.searchsorted(self.edges, values, side='right')
+        binCounts = np.bincount(index, minlength=len(self.edges) + 1)
+
+        self.underflow += int(binCounts[0])
+        self.counts += binCounts[1:-1]
+        self.overflow += int(binCounts[-1])
+        self.total += float(values.sum())
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+
+        return self
+
+
+    def merge(self, other):
+
+        """Add the counts of another histogram with the same bin edges."""
+
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError('Only histograms with the same bin edges can be merged.')
+
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+        return self
+
+
+    def toDict(self):
+
+        """Get the state of the histogram as a dictionary (JSON serializable)."""
+
+        return {'edges': self.edges.tolist(),
+                'counts': self.counts.tolist(),
+                'underflow': self.underflow,
+                'overflow': self.overflow,
+                'total': self.total,
+                'minimum': self.minimum if self.count else None,
+                'maximum': self.maximum if self.count else None,
+                }
+
+
+    @classmethod
+    def fromDict(cls, state):
+
+        """Create a histogram from a state as returned by the method toDict."""
+
+        histogram = cls(state['edges'])
+        histogram.counts = np.asarray(state['counts'], dtype=np.int64)
+        histogram.underflow = int(state['underflow'])
+        histogram.overflow = int(state['overflow'])
+        histogram.total = float(state['total'])
+        histogram.minimum = np.inf if state['minimum'] is None else float(state['minimum'])
+        histogram.maximum = -np.inf if state['maximum'] is None else float(state['maximum'])
+
+        return histogram
+
+
+    def save(self, file):
+
+        """Store the state of the histogram in a JSON file."""
+
+        with open(file, 'w') as outFile:
+            outFile.write(json.dumps(self.toDict()))
+
+
+    @classmethod
+    def load(cls, file):
+
+        """Read the state of a histogram from a JSON file as stored by the method save."""
+
+        with open(file, 'r') as inputFile:
+            return cls.fromDict(json.load(inputFile))
+
+
+    def toFrame(self):
+
+        """Get the bins of the histogram as a dataframe.
+
+        Returns:
+            dfHistogram (type pandas.DataFrame):
+                The columns Left, Right and Count with one row per bin. The overflow bin is the last row
+                (its right edge is inf) and the underflow bin is the first row (its left edge is -inf).
+        """
+
+        return pd.DataFrame({'Left': np.r_[-np.inf, self.edges],
+                             'Right': np.r_[self.edges, np.inf],
+                             'Count': np.r_[self.underflow, self.counts, self.overflow]})
+
+
+
+def histogramEdges(binning = 'fixed', bins = None, maxDuration = None, sample = None):
+
+    """Compute the bin edges of the histogram of the duration of the sessions.
+
+    Parameter:
+        binning (type str):
+            The type of the bins: 'fixed', 'log' or 'quantile' (see __BINNINGS__).
+        bins (type float):
+            The width of the bins in minutes (fixed), or the number of bins (log and quantile).
+            If None, the default of the binning is used.
+        maxDuration (type float):
+            The last bin edge in minutes (fixed and log). The longer sessions are counted in the overflow bin.
+            If None, the default of the binning is used.
+        sample (type numpy.ndarray):
+            A sample of the durations (quantile only), e.g., as returned by the function reservoirSample.
+
+    Returns:
+        edges (type numpy.ndarray)
+    """
+
+    if binning not in __BINNINGS__:
+        raise ValueError(f'The binning must be one of {list(__BINNINGS__)}.')
+
+    bins = __BINNINGS__[binning]['bins'] if bins is None else bins
+    maxDuration = __BINNINGS__[binning]['maxDuration'] if maxDuration is None else maxDuration
+
+    if binning == 'fixed':
+        return np.arange(0, np.ceil(maxDuration/bins) + 1) * bins
+
+    if binning == 'log':
+        return np.r_[0, np.geomspace(__LOGMINDURATION__, maxDuration, int(bins))]
+
+    # Quantiles of the sample (duplicate edges are removed, e.g., if many sessions have the same duration)
+    sample = np.asarray(sample, dtype=float)
+    sample = sample[~np.isnan(sample)]
+    if len(sample) == 0:
+        return np.array([0.0, 1.0])
+    edges = np.unique(np.r_[0, np.quantile(sample, np.linspace(0, 1, int(bins) + 1)[1:])])
+    # At least one bin (e.g., if all the sessions of the sample have zero duration)
+    if len(edges) < 2:
+        edges = np.r_[edges[0], edges[0] + 1]
+    # The longest session of the sample is included in the last bin
+    edges[-1] = np.nextafter(edges[-1], np.inf)
+
+    return edges
+
+
+
+def reservoirSample(chunks, size = 10000, seed = 0):
+
+    """Draw a uniform random sample of fixed size from a stream of chunks of values (reservoir sampling).
+
+    Parameter:
+        chunks (type iterable):
+            The chunks of values (e.g., numpy arrays).
+        size (type int):
+            The size of the sample.
+        seed (type int):
+            The seed of the random generator (the same stream gives the same sample).
+
+    Returns:
+        sample (type numpy.ndarray)
+    """
+
+    rng = np.random.default_rng(seed)
+    sample = np.empty(0)
+    seen = 0
+
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float).ravel()
+
+        # Fill the reservoir with the first values
+        fill = min(size - len(sample), len(chunk))
+        sample = np.r_[sample, chunk[:fill]]
+        seen += fill
+        chunk = chunk[fill:]
+        if len(chunk) == 0:
+            continue
+
+        # Replace a random value of the reservoir with the probability size/(number of values seen so far)
+        position = rng.integers(0, seen + np.arange(1, len(chunk) + 1))
+        replace = position < size
+        # (the last replacement of each position wins, as in the sequential algorithm)
+        sample[position[replace]] = chunk[replace]
+        seen += len(chunk)
+
+    return sample
+
+
+
+def durationHistogram(getChunks, binning = 'fixed', bins = None, maxDuration = None):
+
+    """Accumulate the histogram of the duration of the sessions chunk by chunk.
+
+    Parameter:
+        getChunks (type function):
+            A function without parameters that returns an iterable of chunks of durations in minutes.
+            It is called twice for the quantile binning (one pass to sample the durations and one to count them).
+        binning (type str):
+            The type of the bins: 'fixed', 'log' or 'quantile' (see the function histogramEdges).
+        bins (type float):
+            The width (fixed) or the number (log and quantile) of the bins.
+        maxDuration (type float):
+            The last bin edge in minutes (fixed and log).
+
+    Returns:
+        histogram (type StreamingHistogram)
+    """
+
+    sample = reservoirSample(getChunks()) if binning == 'quantile' else None
+
+    histogram = StreamingHistogram(histogramEdges(binning, bins, maxDuration, sample))
+
+    for chunk in getChunks():
+        histogram.add(chunk)
+
+    return histogram
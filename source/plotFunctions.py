@@ -1,81 +1,421 @@
 import os
-import datetime
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.ticker as ticker
 from matplotlib import colors as mcolors
 import numpy as np
-import json
+from matplotlib.collections import LineCollection
+from cacheFunctions import figureHash, isFigureCached, evictFigure, storeFigureHash
+from trajectoryFunctions import decodePolyline
+from histogramFunctions import durationHistogram
+from aggregateFunctions import weeklySums, foldSessions, iterSessionChunks
+from visibilityFunctions import decodeVisibility
 
 
 
 
 def plotDurationPerWeek(__PROJECTNAME__,
                         file,
-                        format = ['jpg']
+                        format = ['jpg'],
+                        dpi = 200,
+                        xlength = 12,
+                        cache = True,
+                        memoryLimit = 256,
+                        folded = None
                         ):
 
     """Plot two graphs: the duration of the measurements per week and the cumulative duration.
-    
+
     Parameter:
-        __PROJECTNAME__ (type str): 
-            The folder name in which the CAMALIOT text files are stored. 
-        file (type str):               
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        file (type str):
             The path of the relevant JSON file.
         format (type list)
             The list of the user-defined formats to export the figures.
             It supports only the formats jpg, pdf and png.
-        
-    Returns: 
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        xlength (type float):
+            The width of the figures in inches (the height follows the golden ratio).
+        cache (type bool):
+            If True, the rendering is skipped when the figures in the \\figures folder are up to date.
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy while the JSON file is read.
+            The JSON file may also be a folder of JSON files (e.g., one file per month).
+        folded (type tuple):
+            Optional. The weekly sums and the histogram as returned by the function foldSessions. If provided, the
+            JSON file is not read again (e.g., to plot all the figures of the same sessions with one pass over them).
+
+    Returns:
         0
-    """  
-    
-    #### Read data from the JSON file ####
+    """
+
+    #### Read data from the JSON file (in chunks of bounded size) ####
 
     try:
-        # Opening JSON file to read
-        with open(file, 'r') as inputFile:
-            # Read the json file
-            dataJSON = json.load(inputFile)
-        inputFile.close()
+        # Aggregate the sessions chunk by chunk (unless they are already aggregated)
+        dfWeekly = foldSessions(file, memoryLimit)[0] if folded is None else folded[0]
     except:
         print('Problem with opening the JSON file.')
         return 1
-        
-    
+
+
     #### Restructure data before plotting ####
-    
-    # list to collect the required data for the plot 
-    data2plot = []
-    
-    # Iterate the imported list of dictionaries
-    for item in dataJSON:
-        
-        # The starting date-time of each measurement session. It is used to compute the respective day of year (DOY) and week of year (WOY)
-        date = datetime.datetime.strptime(item['Start date-time'],'%Y-%m-%d %H:%M:%S.%f')
-        # The week of year of the measurement session. (It is used in the current implementation to group the data to plot)
-        WOY = date.isocalendar()[1]
-        # The duration of each measurement session
-        Duration = item['Duration [M.f]']
-    
-        # List of the aforementioned data
-        values2plot = [WOY,
-                       Duration, 
-                       ]
-        
-        # Append data to a list
-        data2plot.append(values2plot)
 
-          
-    # Create the header (name of columns) of the dataframe    
-    columns2plot = ['WOY', 'Duration']
-    
-    # Create a dataframe with the values to be used in the plot
-    df2plot = pd.DataFrame(data2plot, columns=columns2plot)
-    # Convert the JSON null (None type) values to numpy NaN values
-    df2plot = df2plot.fillna(value=np.nan)
-    
-    # Group data with respect to the week of year
-    df2plot = df2plot.groupby('WOY', as_index=False).agg('sum')
+    df2plot = durationPerWeek(dfWeekly)
+
+
+    #### Plot the duration of the measurements per week ####
+
+    renderFigure(__PROJECTNAME__, 'MeasDurationPerWeek', figDurationPerWeek, df2plot, format, dpi, xlength, cache)
+
+
+    #### Plot the cumulative duration of the measurements ####
+
+    renderFigure(__PROJECTNAME__, 'CumulativeMeasDuration', figCumulativeDuration, df2plot, format, dpi, xlength, cache)
+
+    return 0
+
+
+
+
+
+
+def plotMeasCountPerWeek(__PROJECTNAME__,
+                        file,
+                        format = ['jpg'],
+                        dpi = 200,
+                        xlength = 12,
+                        cache = True,
+                        memoryLimit = 256,
+                        folded = None
+                        ):
+
+    """Plot the cumulative number of the measurements for each GNSS system.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        file (type str):
+            The path of the relevant JSON file.
+        format (type list)
+            The list of the user-defined formats to export the figures.
+            It supports only the formats jpg, pdf and png.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        xlength (type float):
+            The width of the figures in inches (the height follows the golden ratio).
+        cache (type bool):
+            If True, the rendering is skipped when the figures in the \\figures folder are up to date.
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy while the JSON file is read.
+            The JSON file may also be a folder of JSON files (e.g., one file per month).
+        folded (type tuple):
+            Optional. The weekly sums and the histogram as returned by the function foldSessions. If provided, the
+            JSON file is not read again (e.g., to plot all the figures of the same sessions with one pass over them).
+
+    Returns:
+        0
+    """
+
+    #### Read data from the JSON file (in chunks of bounded size) ####
+
+    try:
+        # Aggregate the sessions chunk by chunk (unless they are already aggregated)
+        dfWeekly = foldSessions(file, memoryLimit)[0] if folded is None else folded[0]
+    except:
+        print('Problem with opening the JSON file.')
+        return 1
+
+
+    #### Restructure data before plotting ####
+
+    df2plotCumulative = measCountPerWeek(dfWeekly)
+
+
+    #### Plot the cumulative number of the measurements for each GNSS system ####
+
+    renderFigure(__PROJECTNAME__, 'MeasCountPerWeek', figMeasCountPerWeek, df2plotCumulative, format, dpi, xlength, cache)
+
+    return 0
+
+
+
+
+
+
+
+
+def plotDurationHistogram(__PROJECTNAME__,
+                          file,
+                          format = ['jpg'],
+                          dpi = 200,
+                          xlength = 12,
+                          cache = True,
+                          binning = 'fixed',
+                          bins = None,
+                          maxDuration = None,
+                          memoryLimit = 256,
+                          folded = None
+                          ):
+
+    """Plot the histogram of the duration of the sessions.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        file (type str):
+            The path of the relevant JSON file.
+        format (type list)
+            The list of the user-defined formats to export the figures.
+            It supports only the formats jpg, pdf and png.
+        binning (type str):
+            The type of the bins: 'fixed' (1 minute up to 120 minutes by default), 'log' (30 logarithmic bins
+            up to one week by default) or 'quantile' (20 bins with the same number of sessions by default).
+        bins (type float):
+            The width of the bins in minutes (fixed), or the number of bins (log and quantile).
+        maxDuration (type float):
+            The last bin edge in minutes (fixed and log). The longer sessions are shown in a separate bar.
+            The options binning, bins and maxDuration are ignored if the option folded is provided.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        xlength (type float):
+            The width of the figures in inches (the height follows the golden ratio).
+        cache (type bool):
+            If True, the rendering is skipped when the figures in the \\figures folder are up to date.
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy while the JSON file is read.
+            The JSON file may also be a folder of JSON files (e.g., one file per month).
+        folded (type tuple):
+            Optional. The weekly sums and the histogram as returned by the function foldSessions. If provided, the
+            JSON file is not read again (e.g., to plot all the figures of the same sessions with one pass over them).
+
+    Returns:
+        0
+    """
+
+    #### Read data from the JSON file (in chunks of bounded size) ####
+
+    try:
+        # Aggregate the sessions chunk by chunk (unless they are already aggregated)
+        histogram = foldSessions(file, memoryLimit, binning, bins, maxDuration)[1] if folded is None else folded[1]
+    except:
+        print('Problem with opening the JSON file.')
+        return 1
+
+    if histogram is None:
+        print('The aggregated sessions do not include the histogram of the duration (see the option binning of foldSessions).')
+        return 1
+
+
+    #### Restructure data before plotting ####
+
+    df2plot = histogram.toFrame()
+
+
+    #### Plot the histogram of the duration of the sessions ####
+
+    renderFigure(__PROJECTNAME__, 'DurationHistogram', figDurationHistogram, df2plot, format, dpi, xlength, cache)
+
+    return 0
+
+
+
+
+
+
+def plotTrajectories(__PROJECTNAME__,
+                     file,
+                     format = ['jpg'],
+                     dpi = 200,
+                     xlength = 12,
+                     cache = True,
+                     memoryLimit = 256
+                     ):
+
+    """Plot the simplified trajectories of the sessions.
+
+    The trajectories are available only if the function data2dict is called with the option trajectoryTolerance.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        file (type str):
+            The path of the relevant JSON file.
+        format (type list)
+            The list of the user-defined formats to export the figures.
+            It supports only the formats jpg, pdf and png.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        xlength (type float):
+            The width of the figures in inches (the height follows the golden ratio).
+        cache (type bool):
+            If True, the rendering is skipped when the figures in the \\figures folder are up to date.
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy while the JSON file is read.
+            The JSON file may also be a folder of JSON files (e.g., one file per month).
+
+    Returns:
+        0
+    """
+
+    #### Read data from the JSON file (in chunks of bounded size) and restructure data before plotting ####
+
+    try:
+        # Decode the trajectories chunk by chunk (only the points of the simplified trajectories are kept)
+        data2plot = []
+        first = 0
+        for chunk in iterSessionChunks(file, memoryLimit):
+            dfChunk = aggTrajectories(chunk, first)
+            if not dfChunk.empty:
+                data2plot.append(dfChunk)
+            first += len(chunk)
+    except:
+        print('Problem with opening the JSON file.')
+        return 1
+
+    df2plot = pd.concat(data2plot, ignore_index=True) if data2plot else aggTrajectories([])
+
+    if df2plot.empty:
+        print('There are no trajectories in the JSON file.')
+        return 1
+
+
+    #### Plot the trajectories of the sessions ####
+
+    renderFigure(__PROJECTNAME__, 'Trajectories', figTrajectories, df2plot, format, dpi, xlength, cache)
+
+    return 0
+
+
+
+
+
+def plotSatelliteVisibility(__PROJECTNAME__,
+                            file,
+                            session = 0,
+                            format = ['jpg'],
+                            dpi = 200,
+                            xlength = 12,
+                            cache = True,
+                            memoryLimit = 256
+                            ):
+
+    """Plot the number of satellites per GNSS system over the time of a session.
+
+    The satellite visibility is available only if the function data2dict is called with the option visibilityInterval.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        file (type str):
+            The path of the relevant JSON file (or of a folder of JSON files, see the function iterSessionChunks).
+        session (type int):
+            The index of the session in the JSON file. The figure is named SatelliteVisibility_{session}.
+        format (type list)
+            The list of the user-defined formats to export the figures.
+            It supports only the formats jpg, pdf and png.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        xlength (type float):
+            The width of the figures in inches (the height follows the golden ratio).
+        cache (type bool):
+            If True, the rendering is skipped when the figures in the \\figures folder are up to date.
+        memoryLimit (type float):
+            The approximate memory in MB that a chunk of sessions may occupy while the JSON file is read.
+
+    Returns:
+        0
+    """
+
+    #### Read the session from the JSON file ####
+
+    try:
+        # Read the sessions in chunks until the requested session
+        item = None
+        first = 0
+        for chunk in iterSessionChunks(file, memoryLimit):
+            if session < first + len(chunk):
+                item = chunk[session - first]
+                break
+            first += len(chunk)
+    except:
+        print('Problem with opening the JSON file.')
+        return 1
+
+    if item is None or 'SatelliteVisibility' not in item:
+        print(f'There is no satellite visibility of the session {session} in the JSON file.')
+        return 1
+
+
+    #### Restructure data before plotting ####
+
+    df2plot = aggSatelliteVisibility(item)
+
+
+    #### Plot the satellite visibility of the session ####
+
+    renderFigure(__PROJECTNAME__, f'SatelliteVisibility_{session}', figSatelliteVisibility, df2plot, format, dpi, xlength, cache)
+
+    return 0
+
+
+
+
+
+def aggDurationPerWeek(dataJSON):
+
+    """Aggregate the duration of the measurements per week and the cumulative duration.
+
+    Parameter:
+        dataJSON (type list):
+            A list of dictionaries containing the required data (as stored in the JSON file).
+
+    Returns:
+        df2plot (type pandas.DataFrame):
+            The columns WOY, Duration [min] and CumulativeDuration [hr] for every week of the interval.
+    """
+
+    return durationPerWeek(weeklySums(dataJSON))
+
+
+
+
+
+def aggMeasCountPerWeek(dataJSON):
+
+    """Aggregate the cumulative number of the measurements per week for each GNSS system.
+
+    Parameter:
+        dataJSON (type list):
+            A list of dictionaries containing the required data (as stored in the JSON file).
+
+    Returns:
+        df2plotCumulative (type pandas.DataFrame):
+            The column WOY and one column per GNSS system for every week of the interval.
+    """
+
+    return measCountPerWeek(weeklySums(dataJSON))
+
+
+
+
+
+def durationPerWeek(dfWeekly):
+
+    """Compute the duration of the measurements per week and the cumulative duration from the weekly sums.
+
+    Parameter:
+        dfWeekly (type pandas.DataFrame):
+            The weekly sums as returned by the function weeklySums (or foldSessions).
+
+    Returns:
+        df2plot (type pandas.DataFrame):
+            The columns WOY, Duration [min] and CumulativeDuration [hr] for every week of the interval.
+    """
+
+    df2plot = dfWeekly[['WOY', 'Duration']]
 
     # Create a dataframe that contains all the week numbers for the given interval of the measurement sessions
     dfWOY = pd.DataFrame(range(df2plot['WOY'].min(), df2plot['WOY'].max()+1),
@@ -83,37 +423,185 @@ def plotDurationPerWeek(__PROJECTNAME__,
 
     # Create a dataframe in which the weeks of the year that have no measurements will be filled with NaN values
     df2plot = dfWOY.join(df2plot.set_index('WOY'), on='WOY')
-    
+
     # Convert the numpy NaN values to zeros (0)
     df2plot = df2plot.fillna(0)
-    
+
     # Compute the cumulative duration of the measurements
     df2plot['CumulativeDuration'] = df2plot['Duration'].cumsum()/60
-    
 
-    #### Make the \figures folder if it does not already exist ####
+    return df2plot
 
-    # Get the \figures directory to save the following figures
-    dirPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/"))
-    # Make the \figures folder if it does not already exist
-    if not os.path.exists(dirPath):
-        os.makedirs(dirPath)
-        
-        
-    #### Plot the duration of the measurements per week ####     
 
-    
+
+
+
+def measCountPerWeek(dfWeekly):
+
+    """Compute the cumulative number of the measurements per week for each GNSS system from the weekly sums.
+
+    Parameter:
+        dfWeekly (type pandas.DataFrame):
+            The weekly sums as returned by the function weeklySums (or foldSessions).
+
+    Returns:
+        df2plotCumulative (type pandas.DataFrame):
+            The column WOY and one column per GNSS system for every week of the interval.
+    """
+
+    df2plot = dfWeekly.drop(columns=['Duration'])
+
+    # Create a dataframe that contains all the week numbers for the given interval of the measurement sessions
+    dfWOY = pd.DataFrame(range(df2plot['WOY'].min(), df2plot['WOY'].max()+1),
+                      columns=['WOY'])
+
+    # Create a dataframe in which the weeks of the year that have no measurements will be filled with NaN values
+    df2plot = dfWOY.join(df2plot.set_index('WOY'), on='WOY')
+
+    # Convert the numpy NaN values to zeros (0)
+    df2plot = df2plot.fillna(0)
+
+    # Initialize a dataframe to contain the cumulative values
+    df2plotCumulative = pd.DataFrame(df2plot['WOY'])
+
+    # Iterate the columns
+    for column in df2plot:
+
+        if column != 'WOY': # Do not accumulate the WOY values.
+            # Accumulate the values for each column
+            df2plotCumulative[column] = df2plot[column].cumsum()
+
+    return df2plotCumulative
+
+
+
+
+
+def aggDurationHistogram(dataJSON, binning = 'fixed', bins = None, maxDuration = None, chunkSize = 10000):
+
+    """Accumulate the histogram of the duration of the sessions.
+
+    Parameter:
+        dataJSON (type list):
+            A list of dictionaries containing the required data (as stored in the JSON file).
+        binning (type str):
+            The type of the bins: 'fixed', 'log' or 'quantile' (see the function plotDurationHistogram).
+        bins (type float):
+            The width of the bins in minutes (fixed), or the number of bins (log and quantile).
+        maxDuration (type float):
+            The last bin edge in minutes (fixed and log).
+        chunkSize (type int):
+            The number of sessions that are added to the histogram at once.
+
+    Returns:
+        df2plot (type pandas.DataFrame):
+            The columns Left, Right and Count [sessions] with one row per bin
+            (the first row is the underflow bin and the last row is the overflow bin).
+    """
+
+    def getChunks():
+        # The duration of the sessions in chunks (the JSON null values are counted as zero duration)
+        for start in range(0, len(dataJSON), chunkSize):
+            yield np.array([item['Duration [M.f]'] or 0 for item in dataJSON[start:start+chunkSize]], dtype=float)
+
+    return durationHistogram(getChunks, binning, bins, maxDuration).toFrame()
+
+
+
+
+
+def aggTrajectories(dataJSON, first = 0):
+
+    """Decode the simplified trajectories of the sessions.
+
+    Parameter:
+        dataJSON (type list):
+            A list of dictionaries containing the required data (as stored in the JSON file).
+        first (type int):
+            The index of the first session of dataJSON (e.g., if the sessions are read in chunks).
+
+    Returns:
+        df2plot (type pandas.DataFrame):
+            The columns Session (index of the session), Latitude and Longitude with one row per point.
+    """
+
+    # list to collect the required data for the plot
+    data2plot = []
+
+    # Iterate the imported list of dictionaries
+    for session, item in enumerate(dataJSON, first):
+
+        # Skip the sessions without trajectory
+        if 'Trajectory (encoded polyline)' not in item:
+            continue
+
+        # The points of the simplified trajectory
+        lat, lon = decodePolyline(item['Trajectory (encoded polyline)'])
+
+        # Append data to a list
+        data2plot.append(pd.DataFrame({'Session': session, 'Latitude': lat, 'Longitude': lon}))
+
+    # Create a dataframe with the values to be used in the plot
+    if not data2plot:
+        return pd.DataFrame(columns=['Session', 'Latitude', 'Longitude'])
+
+    return pd.concat(data2plot, ignore_index=True)
+
+
+
+
+
+def aggSatelliteVisibility(item):
+
+    """Decode the number of satellites per epoch and GNSS system of a session.
+
+    Parameter:
+        item (type dict):
+            The dictionary of the session (as stored in the JSON file).
+
+    Returns:
+        df2plot (type pandas.DataFrame):
+            The columns Time (minutes since the first epoch) and one column per GNSS system, with one row per epoch
+            (or per interval, if the satellite visibility is downsampled).
+    """
+
+    time, counts = decodeVisibility(item['SatelliteVisibility'])
+
+    # Create a dataframe with the values to be used in the plot
+    df2plot = pd.DataFrame(counts, columns=[item['GnssSystems'][str(i)] for i in range(counts.shape[1])])
+    df2plot.insert(0, 'Time', time/60000)
+
+    return df2plot
+
+
+
+
+
+def figDurationPerWeek(df2plot, xlength = 12):
+
+    """Create the figure of the duration of the measurements per week.
+
+    Parameter:
+        df2plot (type pandas.DataFrame):
+            The aggregated data as returned by the function aggDurationPerWeek.
+        xlength (type float):
+            The width of the figure in inches (the height follows the golden ratio).
+
+    Returns:
+        fig (type matplotlib.figure.Figure)
+    """
+
     fig = plt.figure()
     ax = plt.gca()
-    
+
     # Create a colormap
     cmap = mcolors.LinearSegmentedColormap.from_list("", ["red", "yellow", "green"])
-    
+
     plt.bar(df2plot['WOY'], df2plot['Duration'], color=cmap(df2plot['Duration']/df2plot['Duration'].max()))
 
     step = 1
-    xMin = df2plot['WOY'].min() 
-    xMax = df2plot['WOY'].max() 
+    xMin = df2plot['WOY'].min()
+    xMax = df2plot['WOY'].max()
 
     # x-axis ticks
     ax.set_xticks(np.arange(xMin, xMax + step, step=step))
@@ -121,216 +609,104 @@ def plotDurationPerWeek(__PROJECTNAME__,
     ax.set_xticklabels(np.arange(xMin, xMax + step, step=step), fontsize = 14)
     # x-axis limits
     ax.set_xlim(xMin - 1, xMax + 1)
-    
+
     # y-axis grid
     ax.yaxis.grid()
-    
+
     # x-axis label
     plt.xlabel('Week of year 2022', fontsize = 18)
     # y-axis label
     plt.ylabel('Duration of measurements per week [min]', fontsize = 18)
-       
+
     # attributes of the figure
-    xlength = 12
     fig.set_size_inches(xlength, xlength/1.618)
-    
-    # show the plot
-    plt.show()
-    
-    # Save as .pdf at \figures folder
-    if 'pdf' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_MeasDurationPerWeek.pdf"))
-        fig.savefig(figPath, format='pdf', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_MeasDurationPerWeek.pdf is stored in the \figures folder')
-    # Save as .png at \figures folder
-    if 'png' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_MeasDurationPerWeek.png"))
-        fig.savefig(figPath, format='png', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_MeasDurationPerWeek.png is stored in the \figures folder')
-    # Save as .jpg at \figures folder
-    if 'jpg' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_MeasDurationPerWeek.jpg"))
-        fig.savefig(figPath, format='jpeg', dpi=200, bbox_inches='tight')    
-        print(f'The figure {__PROJECTNAME__}_MeasDurationPerWeek.jpg is stored in the \figures folder')
-        
 
-    #### Plot the cumulative number of the measurements for each GNSS system ####  
-        
+    return fig
+
+
+
+
+
+def figCumulativeDuration(df2plot, xlength = 12):
+
+    """Create the figure of the cumulative duration of the measurements.
+
+    Parameter:
+        df2plot (type pandas.DataFrame):
+            The aggregated data as returned by the function aggDurationPerWeek.
+        xlength (type float):
+            The width of the figure in inches (the height follows the golden ratio).
+
+    Returns:
+        fig (type matplotlib.figure.Figure)
+    """
+
     fig = plt.figure()
     ax = plt.gca()
-    
+
     cmap = mcolors.LinearSegmentedColormap.from_list("", ["red", "yellow", "green"])
-    
+
     plt.bar(df2plot['WOY'], df2plot['CumulativeDuration'], color=cmap(df2plot['CumulativeDuration']/df2plot['CumulativeDuration'].max()))
-    
+
     step = 1
-    xMin = df2plot['WOY'].min() 
-    xMax = df2plot['WOY'].max() 
+    xMin = df2plot['WOY'].min()
+    xMax = df2plot['WOY'].max()
     # x-axis ticks
     ax.set_xticks(np.arange(xMin, xMax + step, step=step))
     # x-axis ticklabels
     ax.set_xticklabels(np.arange(xMin, xMax + step, step=step), fontsize = 14)
     # x-axis limits
     ax.set_xlim(xMin - 1, xMax + 1)
-    
+
     # y-axis grid
     ax.yaxis.grid()
-    
+
     # x-axis label
     plt.xlabel('Week of year 2022', fontsize = 18)
     # y-axis label
     plt.ylabel('Cumulative duration of measurements [hr]', fontsize = 18)
-       
+
     # attributes of the figure
-    xlength = 12
     fig.set_size_inches(xlength, xlength/1.618)
-    
-    # show the plot
-    plt.show()
-    
-    
-    # Save as .pdf at \figures folder
-    if 'pdf' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_CumulativeMeasDuration.pdf"))
-        fig.savefig(figPath, format='pdf', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_CumulativeMeasDuration.pdf is stored in the \figures folder')
-    # Save as .png at \figures folder
-    if 'png' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_CumulativeMeasDuration.png"))
-        fig.savefig(figPath, format='png', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_CumulativeMeasDuration.png is stored in the \figures folder')
-    # Save as .jpg at \figures folder
-    if 'jpg' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_CumulativeMeasDuration.jpg"))
-        fig.savefig(figPath, format='jpeg', dpi=200, bbox_inches='tight')    
-        print(f'The figure {__PROJECTNAME__}_CumulativeMeasDuration.jpg is stored in the \figures folder')
-    
-    return 0
 
+    return fig
 
-            
-            
-            
-            
-def plotMeasCountPerWeek(__PROJECTNAME__,
-                        file,
-                        format = ['jpg']
-                        ):
-    
-    """Plot the cumulative number of the measurements for each GNSS system.
-    
-    Parameter:
-        __PROJECTNAME__ (type str): 
-            The folder name in which the CAMALIOT text files are stored. 
-        file (type str):               
-            The path of the relevant JSON file.
-        format (type list)
-            The list of the user-defined formats to export the figures.
-            It supports only the formats jpg, pdf and png.
-        
-    Returns: 
-        0
-    """  
 
-    #### Read data from the JSON file ####
-    
-    try:
-        # Opening JSON file to read
-        with open(file, 'r') as inputFile:
-            # Read the json file
-            dataJSON = json.load(inputFile)
-        inputFile.close()
-    except:
-        print('Problem with opening the JSON file.')
-        return 1
-        
 
-    #### Restructure data before plotting ####
-          
-    # list to collect the required data for the plot 
-    data2plot = []
-    
-    # Iterate the imported list of dictionaries
-    for item in dataJSON:
-        
-        # The starting date-time of each measurement session. It is used to compute the respective day of year (DOY) and week of year (WOY)
-        date = datetime.datetime.strptime(item['Start date-time'],'%Y-%m-%d %H:%M:%S.%f')
-        # The week of year of the measurement session. (It is used in the current implementation to group the data to plot)
-        WOY = date.isocalendar()[1]
-    
-        # List of the aforementioned data
-        values2plot = [WOY]
-        
-        # Add the measurement count per system as imported from the JSON file
-        values2plot.extend(list(item['MeasCountPerSystem'].values()))
-        
-        # Append data to a list
-        data2plot.append(values2plot)
-        
-        
-    # Create the header (name of columns) of the dataframe    
-    columns2plot = ['WOY']
-    columns2plot.extend(list(item['GnssSystems'].values()))
-    
-    # Create a dataframe with the values to be used in the plot
-    df2plot = pd.DataFrame(data2plot, columns=columns2plot)
-    # Convert the JSON null (None type) values to numpy NaN values
-    df2plot = df2plot.fillna(value=np.nan)
-    
-    # Group data with respect to the week of year
-    df2plot = df2plot.groupby('WOY', as_index=False).agg('sum')
-    
-    # Create a dataframe that contains all the week numbers for the given interval of the measurement sessions
-    dfWOY = pd.DataFrame(range(df2plot['WOY'].min(), df2plot['WOY'].max()+1),
-                      columns=['WOY'])
-    
-    # Create a dataframe in which the weeks of the year that have no measurements will be filled with NaN values
-    df2plot = dfWOY.join(df2plot.set_index('WOY'), on='WOY')
 
-    # Convert the numpy NaN values to zeros (0)
-    df2plot = df2plot.fillna(0)
-    
-    # Initialize a dataframe to contain the cumulative values
-    df2plotCumulative = pd.DataFrame(df2plot['WOY'])
-    
-    # Iterate the columns
-    for column in df2plot:
-        
-        if column != 'WOY': # Do not accumulate the WOY values.
-            # Accumulate the values for each column
-            df2plotCumulative[column] = df2plot[column].cumsum()
-    
 
-    #### Make the \figures folder if it does not already exist ####
-            
-    # Get the \figures directory to save the following figures
-    dirPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/"))
-    # Make the \figures folder if it does not already exist
-    if not os.path.exists(dirPath):
-        os.makedirs(dirPath)
-        
-        
-     
-    #### Plot the cumulative number of the measurements for each GNSS system ####
-        
+def figMeasCountPerWeek(df2plotCumulative, xlength = 12):
+
+    """Create the figure of the cumulative number of the measurements for each GNSS system.
+
+    Parameter:
+        df2plotCumulative (type pandas.DataFrame):
+            The aggregated data as returned by the function aggMeasCountPerWeek.
+        xlength (type float):
+            The width of the figure in inches (the height follows the golden ratio).
+
+    Returns:
+        fig (type matplotlib.figure.Figure)
+    """
+
     fig = plt.figure()
     ax = plt.gca()
-    
+
     # Create a colormap
     cmap = ['#c9c9c9',
-            '#c5d956',  
-            '#ebc03f', 
-            '#dd63df', 
-            '#ff8262', 
-            '#ff6688', 
-            '#8d75ff', 
-            '#ffa246', 
+            '#c5d956',
+            '#ebc03f',
+            '#dd63df',
+            '#ff8262',
+            '#ff6688',
+            '#8d75ff',
+            '#ffa246',
             ]
-    
+
     x = df2plotCumulative['WOY']
     yBottom = pd.Series([0]*len(x))
-    systemList = list(item['GnssSystems'].values())
-    
+    systemList = [column for column in df2plotCumulative if column != 'WOY']
+
     for i, system in enumerate(systemList):
         y = df2plotCumulative[system]/10**6
         if y.sum() == 0: continue
@@ -338,181 +714,334 @@ def plotMeasCountPerWeek(__PROJECTNAME__,
         plt.bar(x, y, bottom = yBottom, color=cmap[i], label=y.name)
         yBottom += y
 
-    
+
     step = 1
-    xMin = df2plot['WOY'].min() 
-    xMax = df2plot['WOY'].max() 
-    
+    xMin = df2plotCumulative['WOY'].min()
+    xMax = df2plotCumulative['WOY'].max()
+
     # x-axis ticks
     ax.set_xticks(np.arange(xMin, xMax + step, step=step))
     # x-axis ticklabels
     ax.set_xticklabels(np.arange(xMin, xMax + step, step=step), fontsize = 14)
     # x-axis limits
     ax.set_xlim(xMin - 1, xMax + 1)
-    
-    import matplotlib.ticker as ticker
-    
+
     # Rewrite the y labels
     # y_labels = ax.get_yticks()
     ax.yaxis.set_major_formatter(ticker.FormatStrFormatter('%.2fM'))
 
     # ax.xaxis.set_major_formatter(million_formatter)
-    
+
     # y-axis grid
     ax.yaxis.grid()
-    
+
     # x-axis label
     plt.xlabel('Week of year 2022', fontsize = 18)
     # y-axis label
     plt.ylabel('Cumulative number of measurements\nper GNSS system (in millions)', fontsize = 18)
-       
+
     # attributes of the figure
-    xlength = 12
     fig.set_size_inches(xlength, xlength/1.618)
-    
+
     # legend
     plt.legend(fontsize = 16)
-    
-    # show the plot
-    plt.show()
-    
-    # Save as .pdf at \figures folder
-    if 'pdf' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_MeasCountPerWeek.pdf"))
-        fig.savefig(figPath, format='pdf', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_MeasCountPerWeek.pdf is stored in the \figures folder')
-    # Save as .png at \figures folder
-    if 'png' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_MeasCountPerWeek.png"))
-        fig.savefig(figPath, format='png', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_MeasCountPerWeek.png is stored in the \figures folder')
-    # Save as .jpg at \figures folder
-    if 'jpg' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_MeasCountPerWeek.jpg"))
-        fig.savefig(figPath, format='jpeg', dpi=200, bbox_inches='tight')    
-        print(f'The figure {__PROJECTNAME__}_MeasCountPerWeek.jpg is stored in the \figures folder')
-          
-    return 0          
-            
 
+    return fig
 
 
 
 
 
+def figDurationHistogram(df2plot, xlength = 12):
 
-def plotDurationHistogram(__PROJECTNAME__,
-                          file,
-                          format = ['jpg']
-                          ):
+    """Create the figure of the histogram of the duration of the sessions.
 
-    """Plot the histogram of the duration of the sessions.
-    
     Parameter:
-        __PROJECTNAME__ (type str): 
-            The folder name in which the CAMALIOT text files are stored. 
-        file (type str):               
-            The path of the relevant JSON file.
-        format (type list)
-            The list of the user-defined formats to export the figures.
-            It supports only the formats jpg, pdf and png.
-        
-    Returns: 
-        0
-    """
+        df2plot (type pandas.DataFrame):
+            The histogram as returned by the function aggDurationHistogram.
+        xlength (type float):
+            The width of the figure in inches (the height follows the golden ratio).
 
-    #### Read data from the JSON file ####
-    
-    try:
-        # Opening JSON file to read
-        with open(file, 'r') as inputFile:
-            # Read the json file
-            dataJSON = json.load(inputFile)
-        inputFile.close()
-    except:
-        print('Problem with opening the JSON file.')
-        return 1
-        
+    Returns:
+        fig (type matplotlib.figure.Figure)
+    """
 
-    #### Restructure data before plotting ####
-          
-    # list to collect the required data for the plot 
-    data2plot = []
-    
-    # Iterate the imported list of dictionaries
-    for item in dataJSON:
-        
-        # The duration of each measurement session
-        Duration = item['Duration [M.f]']
-    
-        # List of the aforementioned data
-        values2plot = [Duration, 
-                       ]
-        
-        # Append data to a list
-        data2plot.append(values2plot)
-        
-        
-    # Create the header (name of columns) of the dataframe    
-    columns2plot = ['Duration']
-    
-    # Create a dataframe with the values to be used in the plot
-    df2plot = pd.DataFrame(data2plot, columns=columns2plot)
-    # Convert the JSON null (None type) values to zeros (0)
-    df2plot = df2plot.fillna(0)
-    
-    
-    #### Make the \figures folder if it does not already exist ####
-    
-    # Get the \figures directory to save the following figures
-    dirPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/"))
-    # Make the \figures folder if it does not already exist
-    if not os.path.exists(dirPath):
-        os.makedirs(dirPath)
-        
-        
-    #### Plot the histogram of the duration of the sessions ####
-    
     fig = plt.figure()
     ax = plt.gca()
-    
-    plt.hist(df2plot['Duration'], bins=range(0,int(np.ceil(df2plot['Duration'].max())),1), rwidth=0.8, color='#7398da')
-      
+
+    # The bins of the histogram (the underflow bin is not shown, since the durations are not negative)
+    dfBins = df2plot.iloc[1:-1]
+    width = dfBins['Right'] - dfBins['Left']
+
+    plt.bar(dfBins['Left'] + 0.1*width, dfBins['Count'], width=0.8*width, align='edge', color='#7398da')
+
+    # The sessions that are longer than the last bin edge are shown in a separate bar after the last bin
+    overflow = df2plot['Count'].iloc[-1]
+    if overflow > 0:
+        plt.bar(dfBins['Right'].iloc[-1] + 0.1*width.iloc[-1], overflow, width=0.8*width.iloc[-1], align='edge',
+                color='#ff8262', label=f"Longer than {dfBins['Right'].iloc[-1]:g} min")
+        plt.legend(fontsize = 16)
+
+    # Logarithmic x-axis for bins of different width (linear below the first bin edge)
+    if not np.allclose(width, width.iloc[0]):
+        ax.set_xscale('symlog', linthresh=dfBins['Right'].iloc[0])
+
+    # x-axis limits (up to the last non-empty bin)
+    nonEmpty = np.flatnonzero(df2plot['Count'].iloc[1:].to_numpy())
+    if len(nonEmpty) > 0:
+        last = min(nonEmpty[-1], len(dfBins) - 1)
+        ax.set_xlim(0, dfBins['Right'].iloc[last] + (width.iloc[-1] if overflow > 0 else 0))
+
     # y-axis grid
     ax.yaxis.grid()
-    
+
     # x-axis label
     plt.xlabel('Duration of measurement session [min]', fontsize = 18)
     # y-axis label
     plt.ylabel('Number of sessions', fontsize = 18)
-       
+
+    # attributes of the figure
+    fig.set_size_inches(xlength, xlength/1.618)
+
+    return fig
+
+
+
+
+
+
+def figTrajectories(df2plot, xlength = 12):
+
+    """Create the figure of the simplified trajectories of the sessions.
+
+    Parameter:
+        df2plot (type pandas.DataFrame):
+            The aggregated data as returned by the function aggTrajectories.
+        xlength (type float):
+            The width of the figure in inches (the height follows the golden ratio).
+
+    Returns:
+        fig (type matplotlib.figure.Figure)
+    """
+
+    fig = plt.figure()
+    ax = plt.gca()
+
+    # Split the points to one line per session (all the lines are drawn at once as a collection)
+    points = df2plot[['Longitude', 'Latitude']].to_numpy(dtype=float)
+    sessionStart = np.flatnonzero(np.diff(df2plot['Session'].to_numpy())) + 1
+    lines = np.split(points, sessionStart)
+
+    ax.add_collection(LineCollection(lines, linewidths=1.5, colors='#7398da'))
+
+    # Mark the starting point of each session (it is the only point of the static sessions)
+    ax.scatter(points[np.r_[0, sessionStart], 0], points[np.r_[0, sessionStart], 1], s=12, color='#ff6688', zorder=3)
+
+    ax.autoscale()
+    # Keep the same scale for both axes at the mean latitude
+    ax.set_aspect(1/np.cos(np.radians(df2plot['Latitude'].mean())))
+
+    # grid
+    ax.grid()
+
+    # x-axis label
+    plt.xlabel('Longitude [deg]', fontsize = 18)
+    # y-axis label
+    plt.ylabel('Latitude [deg]', fontsize = 18)
+
+    # attributes of the figure
+    fig.set_size_inches(xlength, xlength/1.618)
+
+    return fig
+
+
+
+
+
+def figSatelliteVisibility(df2plot, xlength = 12):
+
+    """Create the figure of the number of satellites per GNSS system over the time of a session.
+
+    Parameter:
+        df2plot (type pandas.DataFrame):
+            The aggregated data as returned by the function aggSatelliteVisibility.
+        xlength (type float):
+            The width of the figure in inches (the height follows the golden ratio).
+
+    Returns:
+        fig (type matplotlib.figure.Figure)
+    """
+
+    fig = plt.figure()
+    ax = plt.gca()
+
+    # Create a colormap (the same colors per GNSS system as in the figure of the number of measurements)
+    cmap = ['#c9c9c9',
+            '#c5d956',
+            '#ebc03f',
+            '#dd63df',
+            '#ff8262',
+            '#ff6688',
+            '#8d75ff',
+            '#ffa246',
+            ]
+
+    # The GNSS systems with at least one satellite are stacked (the top is the total number of satellites)
+    systemList = [column for column in df2plot if column != 'Time']
+    shown = [i for i, system in enumerate(systemList) if df2plot[system].sum() > 0]
+
+    if shown:
+        plt.stackplot(df2plot['Time'], [df2plot[systemList[i]] for i in shown], step='post',
+                      colors=[cmap[i] for i in shown], labels=[systemList[i] for i in shown])
+        # legend
+        plt.legend(fontsize = 16, loc='upper left', bbox_to_anchor=(1, 1))
+
+    # x-axis limits
+    if len(df2plot) > 0:
+        ax.set_xlim(df2plot['Time'].min(), df2plot['Time'].max())
+
+    # y-axis grid
+    ax.yaxis.grid()
+
+    # x-axis label
+    plt.xlabel('Time since the first epoch [min]', fontsize = 18)
+    # y-axis label
+    plt.ylabel('Number of satellites\nper GNSS system', fontsize = 18)
+
     # attributes of the figure
-    xlength = 12
     fig.set_size_inches(xlength, xlength/1.618)
-    
+
+    return fig
+
+
+
+
+
+def renderFigure(__PROJECTNAME__,
+                 plotName,
+                 figFunction,
+                 df2plot,
+                 format = ['jpg'],
+                 dpi = 200,
+                 xlength = 12,
+                 cache = True
+                 ):
+
+    """Render a figure and export it to the \\figures folder, unless an up-to-date copy is already there.
+
+    The hash of the aggregated data and of the plot parameters is compared with the render cache
+    of the project. If it matches, the rendering is skipped. Otherwise, the stale files of the figure
+    are deleted, the figure is rendered and exported, and the new hash is recorded.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        plotName (type str):
+            The name of the plot that is used in the file names (e.g., "MeasDurationPerWeek").
+        figFunction (type function):
+            The function that creates the figure from the aggregated data (e.g., figDurationPerWeek).
+        df2plot (type pandas.DataFrame):
+            The aggregated data of the figure.
+        format (type list)
+            The list of the user-defined formats to export the figures.
+            It supports only the formats jpg, pdf and png.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+        xlength (type float):
+            The width of the figures in inches (the height follows the golden ratio).
+        cache (type bool):
+            If True, the rendering is skipped when the figures in the \\figures folder are up to date.
+
+    Returns:
+        0
+    """
+
+    #### Make the \figures folder if it does not already exist ####
+
+    # Get the \figures directory to save the following figures
+    dirPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/"))
+    # Make the \figures folder if it does not already exist
+    if not os.path.exists(dirPath):
+        os.makedirs(dirPath)
+
+
+    #### Skip the rendering if the figure is up to date ####
+
+    hashValue = figureHash(df2plot, plotName, format, dpi, (xlength, xlength/1.618))
+
+    if cache and isFigureCached(__PROJECTNAME__, plotName, hashValue):
+        print(f'The figure {__PROJECTNAME__}_{plotName} is up to date in the \\figures folder')
+        return 0
+
+    # Delete the stale files of the figure
+    evictFigure(__PROJECTNAME__, plotName)
+
+
+    #### Render and export the figure ####
+
+    fig = figFunction(df2plot, xlength)
+
     # show the plot
     plt.show()
-    
+
+    files = saveFigure(fig, __PROJECTNAME__, plotName, format, dpi)
+
+    storeFigureHash(__PROJECTNAME__, plotName, hashValue, files)
+
+    # Release the memory of the figure
+    plt.close(fig)
+
+    return 0
+
+
+
+
+
+def saveFigure(fig, __PROJECTNAME__, plotName, format = ['jpg'], dpi = 200):
+
+    """Export a figure to the \\figures folder.
+
+    Parameter:
+        fig (type matplotlib.figure.Figure):
+            The figure to export.
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        plotName (type str):
+            The name of the plot that is used in the file names (e.g., "MeasDurationPerWeek").
+        format (type list)
+            The list of the user-defined formats to export the figures.
+            It supports only the formats jpg, pdf and png.
+        dpi (type int):
+            The resolution of the exported figures in dots per inch.
+
+    Returns:
+        files (type list):
+            The names of the exported files.
+    """
+
+    files = []
+
     # Save as .pdf at \figures folder
     if 'pdf' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_DurationHistogram.pdf"))
-        fig.savefig(figPath, format='pdf', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_DurationHistogram.pdf is stored in the \figures folder')
+        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_" + plotName + ".pdf"))
+        fig.savefig(figPath, format='pdf', dpi=dpi, bbox_inches='tight')
+        files.append(os.path.basename(figPath))
+        print(f'The figure {__PROJECTNAME__}_{plotName}.pdf is stored in the \\figures folder')
     # Save as .png at \figures folder
     if 'png' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_DurationHistogram.png"))
-        fig.savefig(figPath, format='png', dpi=200, bbox_inches='tight')
-        print(f'The figure {__PROJECTNAME__}_DurationHistogram.png is stored in the \figures folder')
+        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_" + plotName + ".png"))
+        fig.savefig(figPath, format='png', dpi=dpi, bbox_inches='tight')
+        files.append(os.path.basename(figPath))
+        print(f'The figure {__PROJECTNAME__}_{plotName}.png is stored in the \\figures folder')
     # Save as .jpg at \figures folder
     if 'jpg' in format:
-        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_DurationHistogram.jpg"))
-        fig.savefig(figPath, format='jpeg', dpi=200, bbox_inches='tight')    
-        print(f'The figure {__PROJECTNAME__}_DurationHistogram.jpg is stored in the \figures folder')
-        
-    return 0
+        figPath = os.path.abspath(os.path.join(os.getcwd(), "../figures/", __PROJECTNAME__ + "_" + plotName + ".jpg"))
+        fig.savefig(figPath, format='jpeg', dpi=dpi, bbox_inches='tight')
+        files.append(os.path.basename(figPath))
+        print(f'The figure {__PROJECTNAME__}_{plotName}.jpg is stored in the \\figures folder')
+
+    return files
 
 
 # The day of year of the measurement session. (It is not used in the current implementation!)
 # DOY = date.timetuple().tm_yday,
-
-
@@ -0,0 +1,239 @@
+import functools
+from collections import namedtuple
+from operator import itemgetter
+import numpy as np
+import pandas as pd
+
+
+# The columns of the "Fix" and "Raw" records that are required by the application
+__FIXCOLUMNS__ = ('Latitude', 'Longitude', '(UTC)TimeInMs')
+__RAWCOLUMNS__ = ('ConstellationType',)
+
+# The size of the blocks of lines that are read from the CAMALIOT text files (in bytes)
+__READBLOCKSIZE__ = 2**21
+
+# The compiled extractor of the required columns of a record
+#   getter:  Function that returns the values of the required columns from the list of the fields of a record
+#            (a tuple of values, or a single value if only one column is required)
+#   width:   The minimum number of fields of a complete record
+#   columns: The names of the required columns
+#   indices: The indices of the required columns in the fields of a record
+Extractor = namedtuple('Extractor', ['getter', 'width', 'columns', 'indices'])
+
+
+
+
+def parseHeader(line):
+
+    """Parse a header line of a CAMALIOT text file (e.g., "# Fix,Provider,Latitude,Longitude,...").
+
+    Parameter:
+        line (type str):
+            The header line.
+
+    Returns:
+        record (type str):
+            The type of the record that is described by the header (e.g., "Fix").
+        header (type tuple):
+            The names of the columns. The first column is the type of the record, so the indices match
+            the fields of the data lines (e.g., "Fix,gps,46.206871,...").
+    """
+
+    header = tuple(column.strip() for column in line.strip().lstrip('#').split(','))
+
+    return header[0], header
+
+
+
+@functools.lru_cache(maxsize=256)
+def compileExtractor(header, columns):
+
+    """Resolve the indices of the required columns by name and compile an extractor for them.
+
+    The extractors are cached per header signature, so all the files with the same layout share the same extractor.
+
+    Parameter:
+        header (type tuple):
+            The names of the columns as returned by the function parseHeader.
+        columns (type tuple):
+            The names of the required columns.
+
+    Returns:
+        extractor (type Extractor)
+    """
+
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f'The columns {missing} are not in the "# {header[0]}" header.')
+
+    indices = [header.index(column) for column in columns]
+
+    return Extractor(itemgetter(*indices), max(indices) + 1, columns, tuple(indices))
+
+
+
+def readRecords(fullPath, fixColumns = __FIXCOLUMNS__, rawColumns = __RAWCOLUMNS__):
+
+    """Read the required columns of the "Fix" and "Raw" records of a CAMALIOT text file.
+
+    The positions of the columns are resolved by name from the "# Fix" and "# Raw" headers of the file.
+    Incomplete records (e.g., the last line of an interrupted recording) are skipped.
+    The records are not parsed line by line: the file is read in blocks of lines (see __READBLOCKSIZE__), the line
+    breaks and the field separators of each block are located at once (numpy), and the required fields of all
+    the records of the block are gathered from their positions. Therefore, the memory does not grow with the size
+    of the file beyond the extracted values.
+
+    Parameter:
+        fullPath (type str):
+            The path of the CAMALIOT text file.
+        fixColumns (type tuple):
+            The names of the required columns of the "Fix" records.
+        rawColumns (type tuple):
+            The names of the required columns of the "Raw" records.
+
+    Returns:
+        dfFix (type pandas.DataFrame):
+            The required columns of the "Fix" records (numeric values, NaN if invalid).
+        dfRaw (type pandas.DataFrame):
+            The required columns of the "Raw" records (text values as in the file).
+            An exception is raised if the file cannot be read or a record precedes its header.
+    """
+
+    columns = {'Fix': tuple(fixColumns), 'Raw': tuple(rawColumns)}
+    # The last header of each record type (the headers of the previous blocks apply to the next blocks)
+    headers = {'Fix': None, 'Raw': None}
+    frames = {'Fix': [], 'Raw': []}
+
+    with open(fullPath, 'rb') as inputFile:
+        partial = b''
+        while True:
+            data = inputFile.read(__READBLOCKSIZE__)
+            text = partial + data
+
+            # Each block ends with a complete line (the incomplete last line is read with the next block)
+            cut = text.rfind(b'\n') + 1 if data else len(text)
+            if data and cut == 0:
+                partial = text
+                continue
+            block, partial = text[:cut], text[cut:]
+
+            if block:
+                _readBlock(np.frombuffer(block, dtype=np.uint8), columns, headers, frames)
+            if not data:
+                break
+
+    # Initialize pandas dataframe to store the "Fix" data (converted to numbers)
+    dfFix = _concatFrames(frames['Fix'], columns['Fix']).apply(pd.to_numeric, errors='coerce')
+
+    # Initialize pandas dataframe to store the "Raw" data
+    dfRaw = _concatFrames(frames['Raw'], columns['Raw'])
+
+    return dfFix, dfRaw
+
+
+
+def _readBlock(buffer, columns, headers, frames):
+
+    # Gather the required columns of the "Fix" and "Raw" records of a block of complete lines
+
+    # The start and the end (without the line break) of each line
+    breaks = np.flatnonzero(buffer == ord('\n'))
+    starts = np.r_[0, breaks + 1]
+    ends = np.r_[breaks, len(buffer)]
+    # (Windows line breaks)
+    ends = ends - ((ends > starts) & (buffer[np.maximum(ends - 1, 0)] == ord('\r')))
+
+    # The positions of the field separators
+    commas = np.flatnonzero(buffer == ord(','))
+
+    # The headers that apply to the lines of the block: the last header of the previous blocks (line -1)
+    # and the header lines of the block
+    blockHeaders = {record: [(-1, header)] if header is not None else [] for record, header in headers.items()}
+    for line in np.flatnonzero(_startsWith(buffer, starts, ends, b'#')):
+        record, header = parseHeader(buffer[starts[line]:ends[line]].tobytes().decode('utf-8', 'replace'))
+        if record in blockHeaders:
+            blockHeaders[record].append((line, header))
+
+    for record in frames:
+        frames[record].extend(_readRecordType(buffer, starts, ends, commas, record, blockHeaders[record], columns[record]))
+        if blockHeaders[record]:
+            headers[record] = blockHeaders[record][-1][1]
+
+
+
+def _concatFrames(frames, columns):
+
+    # Combine the values of the blocks
+    if not frames:
+        return pd.DataFrame(columns=list(columns))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+
+def _startsWith(buffer, starts, ends, prefix):
+
+    # The lines (given by their start and end positions in the buffer) that start with the prefix
+    match = (ends - starts) >= len(prefix)
+    for k, byte in enumerate(prefix):
+        match &= buffer[np.minimum(starts + k, max(len(buffer) - 1, 0))] == byte if len(buffer) else False
+
+    return match
+
+
+
+def _readRecordType(buffer, starts, ends, commas, record, headers, columns):
+
+    # Gather the required columns of the records of one type in a list of dataframes (one per header).
+    # The records after each header of the type are read with the extractor of that header.
+    lines = np.flatnonzero(_startsWith(buffer, starts, ends, record.encode() + b','))
+
+    if len(lines) and (not headers or lines[0] < headers[0][0]):
+        raise ValueError(f'A "{record}" record precedes the "# {record}" header.')
+
+    blocks = []
+    for i, (headerLine, header) in enumerate(headers):
+        extractor = compileExtractor(header, columns)
+        nextHeaderLine = headers[i + 1][0] if i + 1 < len(headers) else len(starts)
+        blockLines = lines[(lines > headerLine) & (lines < nextHeaderLine)]
+
+        # The index of the first field separator of each record
+        first = np.searchsorted(commas, starts[blockLines])
+
+        # Only the complete records (at least extractor.width fields) are kept
+        last = first + extractor.width - 2
+        complete = (last < len(commas)) & (commas[np.minimum(last, len(commas) - 1)] < ends[blockLines]) if len(commas) else last < 0
+        blockLines, first = blockLines[complete], first[complete]
+        if len(blockLines) == 0:
+            continue
+
+        block = {}
+        for column, index in zip(columns, extractor.indices):
+            # The field is between the separators index - 1 and index (or the end of the line for the last field)
+            fieldStart = commas[first + index - 1] + 1 if index > 0 else starts[blockLines]
+            after = np.minimum(first + index, len(commas) - 1)
+            fieldEnd = np.where((first + index < len(commas)) & (commas[after] < ends[blockLines]), commas[after], ends[blockLines])
+            block[column] = _gatherFields(buffer, fieldStart, fieldEnd)
+        blocks.append(pd.DataFrame(block, columns=list(columns)))
+
+    return blocks
+
+
+
+def _gatherFields(buffer, fieldStart, fieldEnd):
+
+    # The text of the fields (given by their start and end positions in the buffer) as an array of strings
+    lengths = fieldEnd - fieldStart
+    width = int(lengths.max()) if len(lengths) else 0
+    if width == 0:
+        return np.full(len(lengths), '', dtype=object)
+
+    positions = fieldStart[:, None] + np.arange(width)
+    chars = np.where(np.arange(width) < lengths[:, None], buffer[np.minimum(positions, len(buffer) - 1)], 0).astype(np.uint8)
+
+    fields = chars.view(f'S{width}').ravel()
+    try:
+        # ASCII text (the usual case) is decoded by numpy without a loop in Python
+        return fields.astype(str).astype(object)
+    except UnicodeDecodeError:
+        return np.char.decode(fields, 'utf-8', 'replace').astype(object)
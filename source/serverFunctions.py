@@ -0,0 +1,209 @@
+import os
+import io
+import json
+import threading
+import functools
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import matplotlib.pyplot as plt
+from plotFunctions import (aggDurationPerWeek, aggMeasCountPerWeek, aggDurationHistogram, aggTrajectories,
+                           figDurationPerWeek, figCumulativeDuration, figMeasCountPerWeek, figDurationHistogram, figTrajectories)
+
+
+# The plots that are served: the name of the plot, the function that aggregates the data and the function that creates the figure
+__PLOTS__ = {'MeasDurationPerWeek':    (aggDurationPerWeek, figDurationPerWeek),
+             'CumulativeMeasDuration': (aggDurationPerWeek, figCumulativeDuration),
+             'MeasCountPerWeek':       (aggMeasCountPerWeek, figMeasCountPerWeek),
+             'DurationHistogram':      (aggDurationHistogram, figDurationHistogram),
+             'Trajectories':           (aggTrajectories, figTrajectories),
+             }
+
+# The allowed range of the query parameters of the figures (to avoid huge renders)
+__DPIRANGE__ = (10, 600)
+__XLENGTHRANGE__ = (1, 50)
+
+
+
+
+class SessionDataset:
+
+    """The session data of a project kept in memory, with the aggregates and a cache of the rendered figures.
+
+    The JSON file is read only once, and again only if it is modified (e.g., by a new run of the application).
+
+    Parameter:
+        file (type str):
+            The path of the relevant JSON file.
+        cacheSize (type int):
+            The maximum number of rendered figures that are kept in memory (least recently used are dropped).
+    """
+
+    def __init__(self, file, cacheSize = 64):
+
+        self.file = file
+        self.mtime = None
+        self.aggregates = {}
+
+        # pyplot is not thread-safe, therefore the figures are rendered one at a time
+        self.lock = threading.Lock()
+
+        # Cache of the rendered figures keyed by the query parameters
+        self.renderPNG = functools.lru_cache(maxsize=cacheSize)(self._renderPNG)
+
+        self.reload()
+
+
+    def reload(self):
+
+        """Read the JSON file and compute the aggregates, if the file is modified since the last read."""
+
+        mtime = os.path.getmtime(self.file)
+        if mtime == self.mtime:
+            return
+
+        with self.lock:
+            with open(self.file, 'r') as inputFile:
+                dataJSON = json.load(inputFile)
+
+            # Compute each aggregate once, even if it is shared by more than one plot
+            aggregates = {}
+            for aggFunction in set(aggFunction for aggFunction, figFunction in __PLOTS__.values()):
+                aggregates[aggFunction] = aggFunction(dataJSON)
+
+            self.aggregates = {plotName: aggregates[aggFunction] for plotName, (aggFunction, figFunction) in __PLOTS__.items()
+                               if not aggregates[aggFunction].empty}
+            self.mtime = mtime
+
+            # The rendered figures of the previous data are not valid anymore
+            self.renderPNG.cache_clear()
+
+
+    def aggregate(self, plotName):
+
+        """Get the aggregated data of a plot as a list of rows (JSON serializable)."""
+
+        return json.loads(self.aggregates[plotName].to_json(orient='records'))
+
+
+    def _renderPNG(self, plotName, dpi, xlength):
+
+        # Render the figure in memory (it is not stored in the \figures folder)
+        with self.lock:
+            fig = __PLOTS__[plotName][1](self.aggregates[plotName], xlength)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+            plt.close(fig)
+
+        return buffer.getvalue()
+
+
+
+
+
+class _SessionRequestHandler(BaseHTTPRequestHandler):
+
+    # The SessionDataset that is served (assigned by the function serveSessions)
+    dataset = None
+
+
+    def do_GET(self):
+
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        query = parse_qs(url.query)
+
+        try:
+            self.dataset.reload()
+        except:
+            return self._send(500, {'error': 'Problem with opening the JSON file.'})
+
+        # The list of the available plots
+        if not parts:
+            return self._send(200, {'plots': list(self.dataset.aggregates)})
+
+        # The aggregated data of a plot, e.g., /aggregates/MeasDurationPerWeek
+        if len(parts) == 2 and parts[0] == 'aggregates' and parts[1] in self.dataset.aggregates:
+            return self._send(200, self.dataset.aggregate(parts[1]))
+
+        # The figure of a plot, e.g., /figures/MeasDurationPerWeek.png?dpi=100&xlength=12
+        if len(parts) == 2 and parts[0] == 'figures' and parts[1].endswith('.png') and parts[1][:-4] in self.dataset.aggregates:
+            try:
+                dpi = int(query.get('dpi', ['100'])[0])
+                xlength = float(query.get('xlength', ['12'])[0])
+            except ValueError:
+                return self._send(400, {'error': 'The parameters dpi and xlength must be numbers.'})
+
+            if not (__DPIRANGE__[0] <= dpi <= __DPIRANGE__[1] and __XLENGTHRANGE__[0] <= xlength <= __XLENGTHRANGE__[1]):
+                return self._send(400, {'error': f'The parameter dpi must be in {__DPIRANGE__} and xlength in {__XLENGTHRANGE__}.'})
+
+            return self._send(200, self.dataset.renderPNG(parts[1][:-4], dpi, xlength), 'image/png')
+
+        return self._send(404, {'error': f'Unknown path {url.path}'})
+
+
+    def _send(self, status, body, contentType = 'application/json'):
+
+        if contentType == 'application/json':
+            body = json.dumps(body).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', contentType)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+
+
+
+def serveSessions(__PROJECTNAME__,
+                  file,
+                  host = '127.0.0.1',
+                  port = 8000,
+                  cacheSize = 64
+                  ):
+
+    """Serve the aggregates and the figures of the session data over HTTP.
+
+    The session data are loaded once and kept in memory. The following paths are served:
+        /                                   The list of the available plots.
+        /aggregates/{plot}                  The aggregated data of a plot in JSON format.
+        /figures/{plot}.png?dpi=&xlength=   The figure of a plot in PNG format (default dpi=100, xlength=12).
+    where {plot} is one of MeasDurationPerWeek, CumulativeMeasDuration, MeasCountPerWeek, DurationHistogram and Trajectories.
+
+    Parameter:
+        __PROJECTNAME__ (type str):
+            The folder name in which the CAMALIOT text files are stored.
+        file (type str):
+            The path of the relevant JSON file.
+        host (type str):
+            The address of the server (by default only local connections are accepted).
+        port (type int):
+            The port of the server.
+        cacheSize (type int):
+            The maximum number of rendered figures that are kept in memory.
+
+    Returns:
+        0
+    """
+
+    # The figures are rendered in memory only (no window is opened)
+    plt.switch_backend('Agg')
+
+    try:
+        dataset = SessionDataset(file, cacheSize)
+    except:
+        print('Problem with opening the JSON file.')
+        return 1
+
+    # Handler class of this server with the dataset to serve
+    handler = type('SessionRequestHandler', (_SessionRequestHandler,), {'dataset': dataset})
+
+    with ThreadingHTTPServer((host, port), handler) as server:
+        print(f'The {__PROJECTNAME__} session data are served at http://{host}:{port}/ (press Ctrl+C to stop)')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
@@ -0,0 +1,154 @@
+import numpy as np
+
+
+# Mean radius of the Earth in meters (used to convert the geographic coordinates to local planar coordinates)
+__EARTHRADIUS__ = 6371008.8
+
+
+
+
+def simplifyTrajectory(lat, lon, tolerance = 5.0):
+
+    """Simplify a trajectory with the Douglas-Peucker algorithm.
+
+    The geographic coordinates are converted to local planar coordinates (equirectangular projection),
+    which is accurate enough for the extent of a measurement session.
+
+    Parameter:
+        lat (type numpy.ndarray):
+            The latitudes of the trajectory in decimal degrees, in chronological order.
+        lon (type numpy.ndarray):
+            The longitudes of the trajectory in decimal degrees, in chronological order.
+        tolerance (type float):
+            The maximum distance in meters between the original and the simplified trajectory.
+
+    Returns:
+        keep (type numpy.ndarray):
+            A boolean mask of the points of the simplified trajectory.
+    """
+
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+
+    # A trajectory with less than three points cannot be simplified
+    if len(lat) < 3:
+        return np.ones(len(lat), dtype=bool)
+
+    # The first and the last points are always kept
+    keep = np.zeros(len(lat), dtype=bool)
+    keep[[0, -1]] = True
+
+    # Local planar coordinates in meters with respect to the first point
+    x = np.radians(lon - lon[0]) * __EARTHRADIUS__ * np.cos(np.radians(np.mean(lat)))
+    y = np.radians(lat - lat[0]) * __EARTHRADIUS__
+
+    # Stack of the segments (indices of the first and last point) that are not yet simplified
+    stack = [(0, len(lat) - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        # Distances of the intermediate points from the segment (vectorized)
+        dx = x[last] - x[first]
+        dy = y[last] - y[first]
+        px = x[first+1:last] - x[first]
+        py = y[first+1:last] - y[first]
+        segmentLength = np.hypot(dx, dy)
+        if segmentLength > 0:
+            distance = np.abs(dx*py - dy*px) / segmentLength
+        else:
+            # The segment is a point (e.g., a static session that ends where it started)
+            distance = np.hypot(px, py)
+
+        # Keep the farthest point and split the segment, if it exceeds the tolerance
+        index = int(np.argmax(distance))
+        if distance[index] > tolerance:
+            index += first + 1
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return keep
+
+
+
+def encodePolyline(lat, lon, precision = 6):
+
+    """Encode a trajectory to a compact string (encoded polyline algorithm format).
+
+    The coordinates are quantized to integers (10^-precision degrees), delta-encoded with respect
+    to the previous point and written as variable-length printable ASCII characters.
+
+    Parameter:
+        lat (type numpy.ndarray):
+            The latitudes of the trajectory in decimal degrees.
+        lon (type numpy.ndarray):
+            The longitudes of the trajectory in decimal degrees.
+        precision (type int):
+            The number of decimal digits of the coordinates to keep.
+
+    Returns:
+        polyline (type str):
+            The encoded trajectory.
+    """
+
+    # Quantize the coordinates to integers
+    factor = 10**precision
+    coords = np.column_stack([np.round(np.asarray(lat, dtype=float)*factor),
+                              np.round(np.asarray(lon, dtype=float)*factor)]).astype(np.int64)
+
+    # Differences with respect to the previous point (the first point with respect to 0, 0)
+    deltas = np.diff(coords, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel()
+
+    # Map the signed integers to unsigned integers (zigzag encoding)
+    values = np.where(deltas < 0, ~(deltas << 1), deltas << 1)
+
+    # Write each value in chunks of 5 bits, starting from the least significant chunk
+    chars = []
+    for value in values.tolist():
+        while value >= 0x20:
+            chars.append(chr((0x20 | (value & 0x1f)) + 63))
+            value >>= 5
+        chars.append(chr(value + 63))
+
+    return ''.join(chars)
+
+
+
+def decodePolyline(polyline, precision = 6):
+
+    """Decode a trajectory that is encoded with the function encodePolyline.
+
+    Parameter:
+        polyline (type str):
+            The encoded trajectory.
+        precision (type int):
+            The number of decimal digits that was used for the encoding.
+
+    Returns:
+        lat (type numpy.ndarray):
+            The latitudes of the trajectory in decimal degrees.
+        lon (type numpy.ndarray):
+            The longitudes of the trajectory in decimal degrees.
+    """
+
+    values = []
+    value = 0
+    shift = 0
+
+    # Read the chunks of 5 bits until the last chunk of each value
+    for char in polyline:
+        chunk = ord(char) - 63
+        value |= (chunk & 0x1f) << shift
+        shift += 5
+        if chunk < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = 0
+            shift = 0
+
+    # Accumulate the differences to get the coordinates
+    coords = np.cumsum(np.array(values, dtype=np.int64).reshape(-1, 2), axis=0) / 10**precision
+
+    return coords[:, 0], coords[:, 1]
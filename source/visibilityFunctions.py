@@ -0,0 +1,177 @@
+import zlib
+import base64
+import numpy as np
+import pandas as pd
+
+
+# The columns of the "Raw" records that are required for the satellite visibility
+__VISIBILITYCOLUMNS__ = ('ElapsedRealtimeMillis', 'TimeNanos', 'Svid', 'ConstellationType')
+
+# The number of GNSS constellation types (0: UNKNOWN, 1: GPS, ..., 7: IRNSS)
+__CONSTELLATIONS__ = 8
+
+
+
+
+def epochCounts(dfRaw):
+
+    """Count the satellites that are tracked in each epoch for each GNSS constellation.
+
+    The "Raw" records of the same epoch have the same TimeNanos (receiver clock). The satellites are
+    identified by their Svid and ConstellationType, so a satellite that is tracked in more than one
+    frequency is counted once.
+
+    Parameter:
+        dfRaw (type pandas.DataFrame):
+            The columns ElapsedRealtimeMillis, TimeNanos, Svid and ConstellationType of the "Raw" records.
+
+    Returns:
+        time (type numpy.ndarray):
+            The time of each epoch in milliseconds since the first epoch (ElapsedRealtimeMillis).
+        counts (type numpy.ndarray):
+            The number of satellites per epoch (rows) and constellation type (8 columns).
+    """
+
+    # Convert the values to numbers (the records with invalid values, e.g., empty fields, are ignored)
+    try:
+        values = dfRaw[list(__VISIBILITYCOLUMNS__)].to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        values = dfRaw[list(__VISIBILITYCOLUMNS__)].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    values = values[~np.isnan(values).any(axis=1)]
+    values = values[(values[:, 3] >= 0) & (values[:, 3] < __CONSTELLATIONS__)]
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros((0, __CONSTELLATIONS__), dtype=np.uint8)
+
+    # The columns in the order of __VISIBILITYCOLUMNS__
+    elapsed, timeNanos, svid, constellation = values.astype(np.int64).T
+
+    # Index of the epoch of each record
+    epochs, epochIndex = np.unique(timeNanos, return_inverse=True)
+
+    # The time of each epoch is the time of its first record
+    epochTime = np.full(len(epochs), np.iinfo(np.int64).max)
+    np.minimum.at(epochTime, epochIndex, elapsed)
+
+    # Unique satellites per epoch and constellation (the Svid is less than 2^16)
+    satellites = np.unique((epochIndex * __CONSTELLATIONS__ + constellation) << 16 | svid)
+    counts = np.bincount(satellites >> 16, minlength=len(epochs) * __CONSTELLATIONS__)
+    counts = counts.reshape(len(epochs), __CONSTELLATIONS__)
+
+    # Sort the epochs in chronological order
+    order = np.argsort(epochTime, kind='stable')
+
+    return epochTime[order] - epochTime[order[0]], np.minimum(counts[order], 255).astype(np.uint8)
+
+
+
+def downsampleCounts(time, counts, interval):
+
+    """Downsample the number of satellites per epoch to fixed intervals.
+
+    Parameter:
+        time (type numpy.ndarray):
+            The time of each epoch in milliseconds (as returned by the function epochCounts).
+        counts (type numpy.ndarray):
+            The number of satellites per epoch and constellation type (as returned by the function epochCounts).
+        interval (type float):
+            The interval in seconds (at least 1 millisecond, otherwise a ValueError is raised).
+
+    Returns:
+        time (type numpy.ndarray):
+            The start time of each interval with at least one epoch in milliseconds.
+        counts (type numpy.ndarray):
+            The mean number of satellites in each interval (rounded) per constellation type.
+    """
+
+    # The interval in milliseconds
+    step = int(round(interval * 1000))
+    if step <= 0:
+        raise ValueError('The interval must be at least 1 millisecond.')
+
+    if len(time) == 0:
+        return time, counts
+
+    # Index of the interval of each epoch
+    intervals, intervalIndex = np.unique(time // step, return_inverse=True)
+
+    # Mean of the epochs of each interval
+    epochsPerInterval = np.bincount(intervalIndex)
+    sums = np.stack([np.bincount(intervalIndex, weights=counts[:, k], minlength=len(intervals))
+                     for k in range(counts.shape[1])], axis=1)
+
+    return intervals * step, np.round(sums / epochsPerInterval[:, None]).astype(np.uint8)
+
+
+
+def encodeVisibility(time, counts, interval = 0):
+
+    """Encode the number of satellites per epoch in a compact JSON serializable format.
+
+    The times are delta-encoded and the counts are stored as bytes. Both are compressed (zlib) and
+    converted to text (base64).
+
+    Parameter:
+        time (type numpy.ndarray):
+            The time of each epoch (or interval) in milliseconds.
+        counts (type numpy.ndarray):
+            The number of satellites per epoch (or interval) and constellation type.
+        interval (type float):
+            The interval of the downsampling in seconds (0 if the counts are not downsampled).
+
+    Returns:
+        visibility (type dict)
+    """
+
+    deltas = np.diff(np.asarray(time, dtype='<i8'), prepend=0).astype('<i8')
+
+    return {"Interval [s]": interval,
+            "Epochs": int(len(time)),
+            "Time [ms]": base64.b64encode(zlib.compress(deltas.tobytes())).decode('ascii'),
+            "CountPerSystem": base64.b64encode(zlib.compress(np.ascontiguousarray(counts, dtype=np.uint8).tobytes())).decode('ascii'),
+            }
+
+
+
+def decodeVisibility(visibility):
+
+    """Decode the number of satellites per epoch that is encoded with the function encodeVisibility.
+
+    Parameter:
+        visibility (type dict):
+            The encoded satellite visibility.
+
+    Returns:
+        time (type numpy.ndarray):
+            The time of each epoch (or interval) in milliseconds since the first epoch.
+        counts (type numpy.ndarray):
+            The number of satellites per epoch (or interval) and constellation type.
+    """
+
+    deltas = np.frombuffer(zlib.decompress(base64.b64decode(visibility["Time [ms]"])), dtype='<i8')
+    counts = np.frombuffer(zlib.decompress(base64.b64decode(visibility["CountPerSystem"])), dtype=np.uint8)
+
+    return np.cumsum(deltas), counts.reshape(visibility["Epochs"], __CONSTELLATIONS__)
+
+
+
+def satelliteVisibility(dfRaw, interval = 0):
+
+    """Compute the encoded number of satellites per epoch and constellation type of a session.
+
+    Parameter:
+        dfRaw (type pandas.DataFrame):
+            The columns ElapsedRealtimeMillis, TimeNanos, Svid and ConstellationType of the "Raw" records.
+        interval (type float):
+            The interval of the downsampling in seconds (0 to keep every epoch).
+
+    Returns:
+        visibility (type dict):
+            The satellite visibility as returned by the function encodeVisibility.
+    """
+
+    time, counts = epochCounts(dfRaw)
+
+    if interval:
+        time, counts = downsampleCounts(time, counts, interval)
+
+    return encodeVisibility(time, counts, interval)